@@ -2,31 +2,47 @@
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+import asyncio
 import time
 
 from api.routes import verify
+from cloud.base_client import get_http_client, close_http_client
+from core.verification_engine import VerificationEngine
 from utils.config import settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the verification engine and shared HTTP client for the app's lifetime."""
+    app.state.engine = VerificationEngine()
+    app.state.http = get_http_client()
+    yield
+    await close_http_client()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="CircleNClick Verification API",
     description="Content verification service for detecting misinformation",
     version="0.2.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this
+    allow_origins=settings.cors_allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 
@@ -34,10 +50,10 @@ app.add_middleware(
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """Add processing time header to responses."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    process_time = time.perf_counter() - start_time
+    response.headers["X-Process-Time"] = f"{process_time:.6f}"
     return response
 
 
@@ -67,7 +83,7 @@ async def health():
     return {
         "status": "healthy",
         "cloud_apis": settings.has_cloud_apis(),
-        "cache": cache.stats()
+        "cache": await asyncio.to_thread(cache.stats)
     }
 
 
@@ -76,7 +92,7 @@ async def health():
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -86,10 +102,25 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
+
+    # reload and multiple workers are mutually exclusive
+    workers = 1 if settings.api_reload else settings.api_workers
+
+    # Every worker loads its own model; split the CPUs between them instead
+    # of giving each one a thread per CPU (workers inherit the environment,
+    # which the classifier reads before importing torch)
+    threads = str(max(1, (os.cpu_count() or 1) // workers))
+    os.environ.setdefault("OMP_NUM_THREADS", threads)
+    os.environ.setdefault("MKL_NUM_THREADS", threads)
+
     uvicorn.run(
         "api.app:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.api_reload
+        reload=settings.api_reload,
+        workers=workers,
+        loop="uvloop",
+        http="httptools"
     )
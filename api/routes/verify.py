@@ -1,11 +1,14 @@
 """Verification API routes."""
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from typing import Dict
 
 from api.schemas import VerifyRequest, VerifyResponse, StatusResponse
-from core.verification_engine import VerificationEngine
-from core.hybrid_decisor import VerificationStrategy
+from core.hybrid_decisor import VerificationStrategy, STRATEGY_BY_NAME
 from utils.config import settings
 from storage.cache import cache
 from utils.logger import get_logger
@@ -14,32 +17,42 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
-# Initialize verification engine (singleton)
-engine = VerificationEngine()
-
 
-@router.post("/verify", response_model=VerifyResponse)
-async def verify_content(request: VerifyRequest):
+@router.post(
+    "/verify",
+    response_model=VerifyResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": VerifyRequest.model_json_schema()}}
+        }
+    }
+)
+async def verify_content(raw: Request):
     """Verify content for misinformation.
 
+    The body is parsed with ``model_validate_json`` so pydantic-core decodes
+    and validates it in a single pass instead of FastAPI's dict-then-validate.
+
     Args:
-        request: Verification request
+        raw: Incoming request carrying a VerifyRequest JSON body
 
     Returns:
         Verification result
     """
+    try:
+        request = VerifyRequest.model_validate_json(await raw.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors()) from e
+
     try:
         logger.info(f"Verification request from {request.platform or 'unknown'}")
 
         # Map strategy string to enum
-        strategy_map = {
-            "local": VerificationStrategy.LOCAL_ONLY,
-            "cloud": VerificationStrategy.CLOUD_ONLY,
-            "hybrid": VerificationStrategy.HYBRID
-        }
-        strategy = strategy_map.get(request.strategy, VerificationStrategy.HYBRID)
+        strategy = STRATEGY_BY_NAME.get(request.strategy, VerificationStrategy.HYBRID)
 
         # Run verification
+        engine = raw.app.state.engine
         result = await engine.verify(
             text=request.text,
             url=request.url,
@@ -48,8 +61,9 @@ async def verify_content(request: VerifyRequest):
             user_preference=strategy
         )
 
-        # Return response
-        return VerifyResponse(**result.to_dict())
+        # Return response (serialized directly, skipping jsonable_encoder
+        # and response-model validation)
+        return Response(content=result.to_json(), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Verification error: {e}", exc_info=True)
@@ -63,9 +77,10 @@ async def get_status():
     Returns:
         Status information
     """
-    cache_stats = cache.stats()
+    # diskcache does blocking file I/O, keep it off the event loop
+    cache_stats = await asyncio.to_thread(cache.stats)
 
-    return StatusResponse(
+    return StatusResponse.model_construct(
         status="running",
         cloud_apis_configured=settings.has_cloud_apis(),
         cache=cache_stats
@@ -73,14 +88,21 @@ async def get_status():
 
 
 @router.delete("/cache")
-async def clear_cache():
+async def clear_cache(request: Request):
     """Clear verification cache.
 
+    Args:
+        request: Incoming request (used to reach the app-scoped engine)
+
     Returns:
         Success message
     """
     try:
-        cache.clear()
+        await asyncio.to_thread(cache.clear)
+        engine = request.app.state.engine
+        engine.content_processor.clear_caches()
+        for client in engine.cloud_clients:
+            client.result_cache.invalidate()
         return {"message": "Cache cleared successfully"}
     except Exception as e:
         logger.error(f"Error clearing cache: {e}")
@@ -88,10 +110,15 @@ async def clear_cache():
 
 
 @router.get("/cache/stats")
-async def get_cache_stats() -> Dict:
+async def get_cache_stats(request: Request) -> Dict:
     """Get cache statistics.
 
+    Args:
+        request: Incoming request (used to reach the app-scoped engine)
+
     Returns:
         Cache stats
     """
-    return cache.stats()
+    stats = await asyncio.to_thread(cache.stats)
+    stats["cloud"] = {client.api_name: client.result_cache.stats() for client in request.app.state.engine.cloud_clients}
+    return stats
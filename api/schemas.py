@@ -1,20 +1,15 @@
 """Pydantic schemas for API requests and responses."""
 
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VerifyRequest(BaseModel):
     """Request schema for content verification."""
 
-    text: str = Field(..., description="Text content to verify", min_length=1)
-    url: Optional[str] = Field(None, description="Source URL of the content")
-    platform: Optional[str] = Field(None, description="Platform name (facebook, twitter, threads)")
-    author: Optional[str] = Field(None, description="Author/username")
-    strategy: Optional[str] = Field("hybrid", description="Verification strategy (local, cloud, hybrid)")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "text": "The Earth is flat",
                 "url": "https://example.com/post/123",
@@ -22,6 +17,13 @@ class VerifyRequest(BaseModel):
                 "strategy": "hybrid"
             }
         }
+    )
+
+    text: str = Field(..., description="Text content to verify", min_length=1)
+    url: Optional[str] = Field(None, description="Source URL of the content")
+    platform: Optional[str] = Field(None, description="Platform name (facebook, twitter, threads)")
+    author: Optional[str] = Field(None, description="Author/username")
+    strategy: Optional[str] = Field("hybrid", description="Verification strategy (local, cloud, hybrid)")
 
 
 class VerifyResponse(BaseModel):
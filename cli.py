@@ -20,13 +20,31 @@ from rich.table import Table
 from rich import box
 
 from core.verification_engine import VerificationEngine
+from cloud.base_client import close_http_client
 from core.models import Verdict
-from core.hybrid_decisor import VerificationStrategy
+from core.hybrid_decisor import VerificationStrategy, STRATEGY_BY_NAME
 from utils.config import settings
 from utils.logger import logger
 
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = None
+
 console = Console()
 
+# Engine is built once per process and reused across commands
+_engine: Optional[VerificationEngine] = None
+
+
+def get_engine() -> VerificationEngine:
+    """Get or create the CLI's verification engine."""
+    global _engine
+    if _engine is None:
+        _engine = VerificationEngine()
+    return _engine
+
 
 def print_banner():
     """Print CLI banner."""
@@ -40,28 +58,31 @@ def print_banner():
     console.print(banner, style="bold cyan")
 
 
+_VERDICT_COLORS = {
+    Verdict.TRUE: "green",
+    Verdict.FALSE: "red",
+    Verdict.MISLEADING: "yellow",
+    Verdict.UNVERIFIABLE: "bright_black",
+    Verdict.UNCERTAIN: "bright_black"
+}
+
+_VERDICT_EMOJIS = {
+    Verdict.TRUE: "✓",
+    Verdict.FALSE: "✗",
+    Verdict.MISLEADING: "⚠",
+    Verdict.UNVERIFIABLE: "?",
+    Verdict.UNCERTAIN: "?"
+}
+
+
 def get_verdict_color(verdict: Verdict) -> str:
     """Get color for verdict display."""
-    colors = {
-        Verdict.TRUE: "green",
-        Verdict.FALSE: "red",
-        Verdict.MISLEADING: "yellow",
-        Verdict.UNVERIFIABLE: "bright_black",
-        Verdict.UNCERTAIN: "bright_black"
-    }
-    return colors.get(verdict, "white")
+    return _VERDICT_COLORS.get(verdict, "white")
 
 
 def get_verdict_emoji(verdict: Verdict) -> str:
     """Get emoji for verdict."""
-    emojis = {
-        Verdict.TRUE: "✓",
-        Verdict.FALSE: "✗",
-        Verdict.MISLEADING: "⚠",
-        Verdict.UNVERIFIABLE: "?",
-        Verdict.UNCERTAIN: "?"
-    }
-    return emojis.get(verdict, "?")
+    return _VERDICT_EMOJIS.get(verdict, "?")
 
 
 def display_result(result):
@@ -155,19 +176,14 @@ def verify(text: Optional[str], file: Optional[str], url: Optional[str], platfor
         sys.exit(1)
 
     # Map strategy string to enum
-    strategy_map = {
-        'local': VerificationStrategy.LOCAL_ONLY,
-        'cloud': VerificationStrategy.CLOUD_ONLY,
-        'hybrid': VerificationStrategy.HYBRID
-    }
-    verification_strategy = strategy_map[strategy]
+    verification_strategy = STRATEGY_BY_NAME[strategy]
 
     # Run verification
     if not output_json:
         with console.status("[bold green]Verifying content...", spinner="dots"):
-            result = asyncio.run(run_verification(content, url, platform, verification_strategy))
+            result = run_async(run_verification(content, url, platform, verification_strategy))
     else:
-        result = asyncio.run(run_verification(content, url, platform, verification_strategy))
+        result = run_async(run_verification(content, url, platform, verification_strategy))
 
     # Display result
     if output_json:
@@ -179,7 +195,7 @@ def verify(text: Optional[str], file: Optional[str], url: Optional[str], platfor
 
 async def run_verification(text: str, url: Optional[str], platform: Optional[str], strategy: VerificationStrategy):
     """Run async verification."""
-    engine = VerificationEngine()
+    engine = get_engine()
     result = await engine.verify(
         text=text,
         url=url,
@@ -189,6 +205,22 @@ async def run_verification(text: str, url: Optional[str], platform: Optional[str
     return result
 
 
+def run_async(coro):
+    """Run a coroutine to completion on a single event loop.
+
+    Uses uvloop when installed. The shared HTTP client is bound to this
+    loop, so it is closed before the loop shuts down.
+    """
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await close_http_client()
+
+    with asyncio.Runner(loop_factory=_loop_factory) as runner:
+        return runner.run(_main())
+
+
 @cli.command()
 def info():
     """Display system information and configuration."""
@@ -240,12 +272,17 @@ def test():
 
     console.print("[bold]Running test cases...[/bold]\n")
 
-    for text, description in test_cases:
-        console.print(f"[cyan]Test:[/cyan] {text}")
-        console.print(f"[dim]Expected: {description}[/dim]")
+    async def run_test_cases():
+        return await asyncio.gather(*(
+            run_verification(text, None, None, VerificationStrategy.LOCAL_ONLY)
+            for text, _ in test_cases
+        ))
 
-        result = asyncio.run(run_verification(text, None, None, VerificationStrategy.LOCAL_ONLY))
+    results = run_async(run_test_cases())
 
+    for (text, description), result in zip(test_cases, results):
+        console.print(f"[cyan]Test:[/cyan] {text}")
+        console.print(f"[dim]Expected: {description}[/dim]")
         console.print(f"[bold]Result:[/bold] {result.verdict.value} ({result.confidence:.1f}% confidence)")
         console.print()
 
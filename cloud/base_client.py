@@ -1,7 +1,14 @@
 """Base client class for cloud API integrations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
 import httpx
 from datetime import datetime
 
@@ -11,10 +18,215 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# httpx only decodes Brotli bodies when brotli (or brotlicffi) is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# Default headers sent by every cloud API request
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, br" if BROTLI_AVAILABLE else "gzip",
+    "User-Agent": "CirclenClick/0.2.0"
+}
+
+# Responses worth retrying: rate limited or a temporarily failing upstream
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Process-wide HTTP client shared by all cloud API clients
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client.
+
+    One connection pool is reused across every API client so keep-alive
+    connections (and their TLS sessions) survive between requests.
+
+    Returns:
+        Shared async HTTP client
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(settings.cloud_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0
+            ),
+            follow_redirects=True
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class ResultCache:
+    """In-memory LRU + TTL cache for cloud API results.
+
+    Keys are content hashes of the normalized claim, so trivially different
+    spellings of the same claim share an entry. Invalidation requests are
+    merged and applied at most once per cooldown window to avoid thrashing
+    the cache down to a 0% hit rate.
+    """
+
+    _WHITESPACE = re.compile(r'\s+')
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0, invalidation_cooldown: float = 10.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            ttl_seconds: Time-to-live for each entry
+            invalidation_cooldown: Minimum seconds between applied invalidations
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.invalidation_cooldown = invalidation_cooldown
+        self._entries: "OrderedDict[str, Tuple[float, CloudVerificationResult]]" = OrderedDict()
+        self._invalidation_pending = False
+        self._last_invalidation = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    # Every cloud client keys the same claims, so normalize and hash each once
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def make_key(cls, claim: str) -> str:
+        """Build a stable cache key for a claim.
+
+        Args:
+            claim: Claim text
+
+        Returns:
+            Hex digest of the normalized claim
+        """
+        normalized = cls._WHITESPACE.sub(' ', unicodedata.normalize('NFKC', claim)).strip().lower()
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[CloudVerificationResult]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached result or None if missing/expired
+        """
+        self._apply_pending_invalidation()
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, result: CloudVerificationResult):
+        """Store a result.
+
+        Args:
+            key: Cache key from make_key
+            result: Result to cache
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Request invalidation; applied once the cooldown has elapsed."""
+        self._invalidation_pending = True
+        self._apply_pending_invalidation()
+
+    def _apply_pending_invalidation(self):
+        """Clear the cache if an invalidation is pending and allowed."""
+        if not self._invalidation_pending:
+            return
+        now = time.monotonic()
+        if now - self._last_invalidation >= self.invalidation_cooldown:
+            self._entries.clear()
+            self._invalidation_pending = False
+            self._last_invalidation = now
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
+class RateLimiter:
+    """Sliding-window limiter allowing at most N acquisitions per period."""
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        """Initialize the limiter.
+
+        Args:
+            max_calls: Maximum calls allowed within one period
+            period: Window length in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a call is allowed, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
 
 class BaseAPIClient(ABC):
     """Base class for cloud API clients."""
 
+    # Per-client request budget for batch verification (None = unlimited)
+    requests_per_minute: Optional[int] = None
+
+    # Retries of transient failures, with exponential backoff from this delay
+    max_retries: int = 2
+    retry_backoff_seconds: float = 0.5
+
     def __init__(self, api_key: Optional[str] = None, timeout: int = 15):
         """Initialize the API client.
 
@@ -25,7 +237,14 @@ class BaseAPIClient(ABC):
         self.api_key = api_key
         self.timeout = timeout
         self.logger = logger
-        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.result_cache = ResultCache(ttl_seconds=settings.cache_ttl_hours * 3600)
+        self._rate_limiter: Optional[RateLimiter] = None
+        if self.requests_per_minute:
+            self._rate_limiter = RateLimiter(self.requests_per_minute)
+        # Caps in-flight HTTP requests to this API across all verifications;
+        # held per request only, never across rate-limit or backoff waits
+        self._request_slots = asyncio.Semaphore(settings.max_concurrent_requests)
 
     @property
     @abstractmethod
@@ -39,23 +258,55 @@ class BaseAPIClient(ABC):
         return self.api_key is not None and len(self.api_key) > 0
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client.
+        """Get the shared HTTP client.
 
         Returns:
             Async HTTP client
         """
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                follow_redirects=True
-            )
-        return self._client
-
-    async def close(self):
-        """Close HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        return get_http_client()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on the shared client, retrying transient failures.
+
+        Each attempt holds one of the client's request slots and is limited to
+        ``self.timeout`` seconds unless the caller passes its own ``timeout``. Connection errors, timeouts and retryable
+        status codes are retried up to ``max_retries`` times, waiting
+        ``retry_backoff_seconds`` and doubling after each attempt (or
+        honouring a numeric Retry-After).
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to ``httpx.AsyncClient.request``
+
+        Returns:
+            Successful response
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries
+        """
+        client = await self._get_client()
+        kwargs.setdefault("timeout", self.timeout)
+        delay = self.retry_backoff_seconds
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._request_slots:
+                    response = await client.request(method, url, **kwargs)
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return response
+                retry_after = response.headers.get("Retry-After", "")
+                wait = float(retry_after) if retry_after.isdigit() else delay
+                self.logger.info(f"{self.api_name}: HTTP {response.status_code}, retrying in {wait:.1f}s")
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise
+                wait = delay
+                self.logger.info(f"{self.api_name}: {type(e).__name__}, retrying in {wait:.1f}s")
+
+            await asyncio.sleep(wait)
+            delay *= 2
 
     @abstractmethod
     async def verify_claim(self, claim: str) -> Optional[CloudVerificationResult]:
@@ -69,35 +320,100 @@ class BaseAPIClient(ABC):
         """
         pass
 
-    async def verify_claims(self, claims: List[str]) -> List[CloudVerificationResult]:
-        """Verify multiple claims.
+    async def verify_claim_coalesced(self, claim: str) -> Optional[CloudVerificationResult]:
+        """Verify a claim, sharing one request among concurrent callers.
+
+        Results are served from the in-memory result cache when possible.
+        While a request for ``claim`` is in flight, further callers await the
+        same future instead of issuing their own HTTP call.
+
+        Args:
+            claim: The claim to verify
+
+        Returns:
+            CloudVerificationResult or None if API unavailable/error
+        """
+        key = self.result_cache.make_key(claim)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_and_cache(key, claim))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(future)
+
+    async def _fetch_and_cache(self, key: str, claim: str) -> Optional[CloudVerificationResult]:
+        """Call the API and cache real responses.
+
+        Args:
+            key: Result cache key
+            claim: The claim to verify
+
+        Returns:
+            CloudVerificationResult or None
+        """
+        result = await self.verify_claim(claim)
+        # Placeholder/fallback results carry no raw response; don't pin them
+        if result is not None and result.raw_response is not None:
+            self.result_cache.set(key, result)
+        return result
+
+    async def verify_claims(
+        self,
+        claims: List[str],
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+        failures: Optional[List[str]] = None
+    ) -> List[CloudVerificationResult]:
+        """Verify multiple claims concurrently.
 
         Args:
             claims: List of claims to verify
+            max_concurrency: Maximum number of in-flight requests to this API
+            timeout: Time limit in seconds for each claim, not counting time
+                spent waiting on the rate limiter (None = no limit)
+            failures: If given, claims that timed out or raised are appended
 
         Returns:
             List of results (may be empty if all fail)
         """
-        results = []
-        for claim in claims:
-            try:
-                result = await self.verify_claim(claim)
-                if result:
-                    results.append(result)
-            except Exception as e:
-                self.logger.warning(f"{self.api_name}: Failed to verify claim: {e}")
-                continue
-        return results
-
-    def __del__(self):
-        """Cleanup on deletion."""
-        if self._client is not None:
-            try:
-                import asyncio
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-                else:
-                    loop.run_until_complete(self.close())
-            except Exception:
-                pass
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(claim: str) -> Optional[CloudVerificationResult]:
+            async with semaphore:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire()
+                return await self._safe_verify(claim, timeout, failures)
+
+        results = await asyncio.gather(*(_bounded(claim) for claim in claims))
+        return [result for result in results if result]
+
+    async def _safe_verify(
+        self,
+        claim: str,
+        timeout: Optional[float] = None,
+        failures: Optional[List[str]] = None
+    ) -> Optional[CloudVerificationResult]:
+        """Verify a claim, logging and swallowing failures.
+
+        Args:
+            claim: The claim to verify
+            timeout: Time limit in seconds (None = no limit)
+            failures: If given, the claim is appended on failure or timeout
+
+        Returns:
+            CloudVerificationResult or None on failure or timeout
+        """
+        try:
+            return await asyncio.wait_for(self.verify_claim_coalesced(claim), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"{self.api_name}: Timed out verifying claim after {timeout}s")
+        except Exception as e:
+            self.logger.warning(f"{self.api_name}: Failed to verify claim: {e}")
+        if failures is not None:
+            failures.append(claim)
+        return None
@@ -1,7 +1,9 @@
 """ClaimBuster API client."""
 
-from typing import Optional
+import asyncio
+from typing import Dict, List, Optional
 from datetime import datetime
+import httpx
 
 from cloud.base_client import BaseAPIClient
 from cloud.response_models import (
@@ -20,6 +22,8 @@ class ClaimBusterClient(BaseAPIClient):
     """
 
     BASE_URL = "https://idir.uta.edu/claimbuster/api/v2/score/text"
+    # Scores every sentence of the input text in one request
+    SENTENCES_URL = "https://idir.uta.edu/claimbuster/api/v2/score/text/sentences/"
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize ClaimBuster client.
@@ -56,8 +60,6 @@ class ClaimBusterClient(BaseAPIClient):
         try:
             self.logger.info(f"{self.api_name}: Analyzing claim: {claim[:50]}...")
 
-            client = await self._get_client()
-
             # Make API request
             headers = {
                 "x-api-key": self.api_key,
@@ -68,21 +70,100 @@ class ClaimBusterClient(BaseAPIClient):
                 "input_text": claim
             }
 
-            response = await client.post(
+            response = await self._request(
+                "POST",
                 self.BASE_URL,
                 headers=headers,
                 json=payload
             )
-            response.raise_for_status()
 
             data = response.json()
 
             return self._parse_response(claim, data)
 
-        except Exception as e:
+        except (httpx.HTTPError, ValueError) as e:
+            # Transport/HTTP failures and undecodable JSON; anything else propagates
             self.logger.error(f"{self.api_name}: Error analyzing claim: {e}")
             return None
 
+    async def verify_claims(
+        self,
+        claims: List[str],
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None,
+        failures: Optional[List[str]] = None
+    ) -> List[CloudVerificationResult]:
+        """Score multiple claims with a single sentences request.
+
+        Cached claims are served from the result cache; the rest are sent
+        together and matched back by sentence text. Claims the API split
+        differently fall back to one request each.
+
+        Args:
+            claims: List of claims to verify
+            max_concurrency: Maximum number of in-flight fallback requests
+            timeout: Time limit in seconds for the batch request and for each
+                fallback claim (None = no limit)
+            failures: If given, claims that timed out or raised are appended
+
+        Returns:
+            List of results (may be empty if all fail)
+        """
+        if not self.is_configured or len(claims) < 2:
+            return await super().verify_claims(claims, max_concurrency, timeout, failures)
+
+        results = []
+        pending: Dict[str, str] = {}  # claim -> cache key
+        for claim in dict.fromkeys(claims):
+            key = self.result_cache.make_key(claim)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                results.append(cached)
+            else:
+                pending[claim] = key
+
+        if not pending:
+            return results
+
+        try:
+            self.logger.info(f"{self.api_name}: Scoring {len(pending)} claims in one request")
+
+            response = await asyncio.wait_for(
+                self._request(
+                    "POST",
+                    self.SENTENCES_URL,
+                    headers={
+                        "x-api-key": self.api_key,
+                        "Content-Type": "application/json"
+                    },
+                    json={"input_text": " ".join(pending)}
+                ),
+                timeout
+            )
+
+            for item in response.json().get("results", []):
+                claim = item.get("text", "").strip()
+                key = pending.pop(claim, None)
+                if key is None:
+                    continue
+                result = self._parse_response(claim, {"results": [item]})
+                if result is not None:
+                    self.result_cache.set(key, result)
+                    results.append(result)
+
+        except asyncio.TimeoutError:
+            # The batch already used up the time budget; don't start over per claim
+            self.logger.warning(f"{self.api_name}: Timed out scoring claims after {timeout}s")
+            if failures is not None:
+                failures.extend(pending)
+            return results
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.error(f"{self.api_name}: Error scoring claims: {e}")
+
+        if pending:
+            results.extend(await super().verify_claims(list(pending), max_concurrency, timeout, failures))
+        return results
+
     def _parse_response(self, claim: str, data: dict) -> Optional[CloudVerificationResult]:
         """Parse ClaimBuster response.
 
@@ -2,6 +2,7 @@
 
 from typing import Optional, List
 from datetime import datetime
+import httpx
 
 from cloud.base_client import BaseAPIClient
 from cloud.response_models import (
@@ -54,8 +55,6 @@ class FactiverseClient(BaseAPIClient):
         try:
             self.logger.info(f"{self.api_name}: Verifying claim: {claim[:50]}...")
 
-            client = await self._get_client()
-
             # Make API request
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
@@ -68,18 +67,19 @@ class FactiverseClient(BaseAPIClient):
             }
 
             # Note: Actual endpoint may vary - this is a generic implementation
-            response = await client.post(
+            response = await self._request(
+                "POST",
                 f"{self.BASE_URL}/fact-check",
                 headers=headers,
                 json=payload
             )
-            response.raise_for_status()
 
             data = response.json()
 
             return self._parse_response(claim, data)
 
-        except Exception as e:
+        except (httpx.HTTPError, ValueError) as e:
+            # Transport/HTTP failures and undecodable JSON; anything else propagates
             self.logger.error(f"{self.api_name}: Error verifying claim: {e}")
             # Return placeholder result if API fails
             return self._create_placeholder_result(claim)
@@ -103,17 +103,18 @@ class FactiverseClient(BaseAPIClient):
             # Normalize verdict to our rating system
             rating = normalize_rating(verdict)
 
-            # Extract sources from evidence
-            sources: List[FactCheckSource] = []
-            for item in evidence[:5]:  # Limit to 5 sources
-                source = FactCheckSource(
+            # Extract sources from evidence (limit to 5 sources)
+            now = datetime.now()
+            sources: List[FactCheckSource] = [
+                FactCheckSource(
                     name=item.get("source", "Unknown"),
                     url=item.get("url"),
-                    date=datetime.now(),
+                    date=now,
                     rating=rating,
                     excerpt=item.get("text", "")[:200]
                 )
-                sources.append(source)
+                for item in evidence[:5]
+            ]
 
             # Generate explanation
             explanation = data.get("explanation", self._generate_explanation(rating, len(sources)))
@@ -1,18 +1,33 @@
 """Google Fact Check Tools API client."""
 
+import asyncio
+import sys
+import threading
+from collections import Counter
+from dataclasses import replace
 from typing import Optional, List
 from datetime import datetime
+from urllib.parse import quote, quote_plus
 import httpx
+import orjson
 
 from cloud.base_client import BaseAPIClient
+from cloud.semantic_cache import SemanticResultCache
 from cloud.response_models import (
     CloudVerificationResult,
     FactCheckSource,
     ClaimRating,
     normalize_rating
 )
+from model.semantic_classifier import get_semantic_classifier
 from utils.config import settings
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    # Python 3.11+ fromisoformat accepts the trailing "Z" Google sends
+    parse_datetime = datetime.fromisoformat
+
 
 class GoogleFactCheckClient(BaseAPIClient):
     """Client for Google Fact Check Tools API.
@@ -21,6 +36,21 @@ class GoogleFactCheckClient(BaseAPIClient):
     """
 
     BASE_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+    LANGUAGE_CODE = "en"
+
+    # Keep batch fan-out inside the API's per-minute quota
+    requests_per_minute = 60
+
+    # Explanation phrasing per overall rating
+    _RATING_DESCRIPTIONS = {
+        ClaimRating.TRUE: "verified as true",
+        ClaimRating.MOSTLY_TRUE: "rated as mostly true",
+        ClaimRating.MIXED: "received mixed ratings",
+        ClaimRating.MOSTLY_FALSE: "rated as mostly false",
+        ClaimRating.FALSE: "debunked as false",
+        ClaimRating.UNVERIFIABLE: "could not be verified",
+        ClaimRating.UNCERTAIN: "received uncertain ratings"
+    }
 
     def __init__(self, api_key: Optional[str] = None):
         """Initialize Google Fact Check client.
@@ -32,12 +62,41 @@ class GoogleFactCheckClient(BaseAPIClient):
             api_key=api_key or settings.google_factcheck_api_key,
             timeout=settings.cloud_timeout_seconds
         )
+        self._semantic_cache: Optional[SemanticResultCache] = None
+        self._semantic_cache_checked = False
+        self._semantic_cache_lock = threading.Lock()
+
+        # Only the claim varies per request, so encode the fixed params once.
+        # pageSize=1: only the top match is used, so don't download the rest
+        self._url_prefix = (
+            f"{self.BASE_URL}?key={quote(self.api_key or '', safe='')}"
+            f"&languageCode={self.LANGUAGE_CODE}&pageSize=1&query="
+        )
 
     @property
     def api_name(self) -> str:
         """Get API name."""
         return "Google Fact Check"
 
+    def _get_semantic_cache(self) -> Optional[SemanticResultCache]:
+        """Get the semantic cache, if an embedding model is available.
+
+        May load the embedding model, so call it off the event loop.
+
+        Returns:
+            SemanticResultCache or None when running without transformers
+        """
+        with self._semantic_cache_lock:
+            if not self._semantic_cache_checked:
+                classifier = get_semantic_classifier()
+                if classifier.is_model_available():
+                    self._semantic_cache = SemanticResultCache(
+                        encode=classifier.model.encode,
+                        ttl_seconds=settings.cache_ttl_hours * 3600
+                    )
+                self._semantic_cache_checked = True
+        return self._semantic_cache
+
     async def verify_claim(self, claim: str) -> Optional[CloudVerificationResult]:
         """Verify a claim using Google Fact Check API.
 
@@ -51,22 +110,28 @@ class GoogleFactCheckClient(BaseAPIClient):
             self.logger.warning(f"{self.api_name}: API key not configured")
             return None
 
+        # Near-duplicate claims reuse an earlier fact-check (only "en" is queried,
+        # so entries can't leak across languages)
+        # Loading the model and encoding are CPU-bound; keep them off the loop
+        semantic_cache = self._semantic_cache
+        if not self._semantic_cache_checked:
+            semantic_cache = await asyncio.to_thread(self._get_semantic_cache)
+        claim_vector = None
+        if semantic_cache is not None:
+            claim_vector = await asyncio.to_thread(semantic_cache.embed, claim)
+            cached = semantic_cache.lookup(claim_vector, claim)
+            if cached is not None:
+                self.logger.info(f"{self.api_name}: Semantic cache hit for claim: {claim[:50]}...")
+                # Answer for this claim, not the near-duplicate it was cached under
+                return replace(cached, claim=claim)
+
         try:
             self.logger.info(f"{self.api_name}: Searching for claim: {claim[:50]}...")
 
-            client = await self._get_client()
-
             # Make API request
-            params = {
-                "key": self.api_key,
-                "query": claim,
-                "languageCode": "en"
-            }
-
-            response = await client.get(self.BASE_URL, params=params)
-            response.raise_for_status()
+            response = await self._request("GET", self._url_prefix + quote_plus(claim))
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Parse response
             if "claims" not in data or len(data["claims"]) == 0:
@@ -76,12 +141,18 @@ class GoogleFactCheckClient(BaseAPIClient):
             # Process first claim match
             claim_data = data["claims"][0]
 
-            return self._parse_claim_review(claim, claim_data)
+            result = self._parse_claim_review(claim, claim_data)
+
+            # Only cache informative results
+            if claim_vector is not None and result is not None and result.confidence > 0:
+                semantic_cache.store(claim_vector, result)
+
+            return result
 
         except httpx.HTTPStatusError as e:
             self.logger.error(f"{self.api_name}: HTTP error {e.response.status_code}: {e}")
             return None
-        except Exception as e:
+        except (httpx.HTTPError, ValueError) as e:
             self.logger.error(f"{self.api_name}: Error verifying claim: {e}")
             return None
 
@@ -102,7 +173,8 @@ class GoogleFactCheckClient(BaseAPIClient):
                 return None
 
             sources: List[FactCheckSource] = []
-            ratings: List[ClaimRating] = []
+            rating_counts: Counter = Counter()
+            first_rating: Optional[ClaimRating] = None
 
             # Extract all fact-check reviews
             for review in claim_reviews:
@@ -111,19 +183,22 @@ class GoogleFactCheckClient(BaseAPIClient):
 
                 # Normalize rating
                 rating = normalize_rating(textual_rating)
-                ratings.append(rating)
+                rating_counts[rating] += 1
+                if first_rating is None:
+                    first_rating = rating
 
                 # Parse date
                 review_date = None
                 if "reviewDate" in review:
                     try:
-                        review_date = datetime.fromisoformat(review["reviewDate"].replace("Z", "+00:00"))
-                    except Exception:
+                        review_date = parse_datetime(review["reviewDate"])
+                    except (ValueError, TypeError):
                         pass
 
                 # Create source
                 source = FactCheckSource(
-                    name=publisher.get("name", "Unknown"),
+                    # Publisher names repeat across reviews; share one string each
+                    name=sys.intern(publisher.get("name", "Unknown")),
                     url=review.get("url"),
                     date=review_date,
                     rating=rating,
@@ -132,15 +207,11 @@ class GoogleFactCheckClient(BaseAPIClient):
                 )
                 sources.append(source)
 
-            # Determine overall rating (use most common or most recent)
-            if not ratings:
-                overall_rating = ClaimRating.UNCERTAIN
-            else:
-                # Use first rating (Google usually orders by relevance)
-                overall_rating = ratings[0]
+            # Use first rating (Google usually orders by relevance)
+            overall_rating = first_rating or ClaimRating.UNCERTAIN
 
             # Calculate confidence based on source count and agreement
-            confidence = self._calculate_confidence(ratings)
+            confidence = self._calculate_confidence(rating_counts)
 
             # Generate explanation
             explanation = self._generate_explanation(sources, overall_rating)
@@ -159,27 +230,28 @@ class GoogleFactCheckClient(BaseAPIClient):
             self.logger.error(f"{self.api_name}: Error parsing claim review: {e}")
             return None
 
-    def _calculate_confidence(self, ratings: List[ClaimRating]) -> float:
+    def _calculate_confidence(self, rating_counts: Counter) -> float:
         """Calculate confidence score based on ratings.
 
         Args:
-            ratings: List of ratings from different sources
+            rating_counts: Number of sources per rating
 
         Returns:
             Confidence score 0-100
         """
-        if not ratings:
+        total = sum(rating_counts.values())
+        if not total:
             return 0.0
 
         # Base confidence on number of sources
-        source_confidence = min(len(ratings) * 15, 60)
+        source_confidence = min(total * 15, 60)
 
         # Bonus if all sources agree
-        if len(set(ratings)) == 1:
+        if len(rating_counts) == 1:
             source_confidence += 30
 
         # Bonus for multiple sources
-        if len(ratings) >= 3:
+        if total >= 3:
             source_confidence += 10
 
         return min(source_confidence, 95.0)
@@ -199,17 +271,7 @@ class GoogleFactCheckClient(BaseAPIClient):
         if source_count == 0:
             return "No fact-checks found for this claim."
 
-        rating_text = {
-            ClaimRating.TRUE: "verified as true",
-            ClaimRating.MOSTLY_TRUE: "rated as mostly true",
-            ClaimRating.MIXED: "received mixed ratings",
-            ClaimRating.MOSTLY_FALSE: "rated as mostly false",
-            ClaimRating.FALSE: "debunked as false",
-            ClaimRating.UNVERIFIABLE: "could not be verified",
-            ClaimRating.UNCERTAIN: "received uncertain ratings"
-        }
-
-        rating_desc = rating_text.get(rating, "was fact-checked")
+        rating_desc = self._RATING_DESCRIPTIONS.get(rating, "was fact-checked")
 
         if source_count == 1:
             source_name = sources[0].name
@@ -1,7 +1,9 @@
 """Response models for cloud API results."""
 
+import re
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict
 from datetime import datetime
 
@@ -17,8 +19,13 @@ class ClaimRating(Enum):
     UNVERIFIABLE = "UNVERIFIABLE"
     UNCERTAIN = "UNCERTAIN"
 
+    # Members are singletons, so identity hashing is exact and runs in C
+    # (Enum's default hashes the member name in Python). Ratings are counted
+    # and looked up in dicts on every aggregation.
+    __hash__ = object.__hash__
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FactCheckSource:
     """A source that fact-checked a claim."""
 
@@ -30,7 +37,7 @@ class FactCheckSource:
     excerpt: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CloudVerificationResult:
     """Standardized result from a cloud API."""
 
@@ -53,6 +60,18 @@ class CloudVerificationResult:
         return len(self.sources)
 
 
+# Numeric score per rating, from 0 (false) to 100 (true)
+_RATING_SCORES = {
+    ClaimRating.TRUE: 100.0,
+    ClaimRating.MOSTLY_TRUE: 75.0,
+    ClaimRating.MIXED: 50.0,
+    ClaimRating.MOSTLY_FALSE: 25.0,
+    ClaimRating.FALSE: 0.0,
+    ClaimRating.UNVERIFIABLE: 50.0,
+    ClaimRating.UNCERTAIN: 50.0
+}
+
+
 def rating_to_score(rating: ClaimRating) -> float:
     """Convert rating to numeric score (0-100).
 
@@ -62,46 +81,50 @@ def rating_to_score(rating: ClaimRating) -> float:
     Returns:
         Numeric score from 0 (false) to 100 (true)
     """
-    scores = {
-        ClaimRating.TRUE: 100.0,
-        ClaimRating.MOSTLY_TRUE: 75.0,
-        ClaimRating.MIXED: 50.0,
-        ClaimRating.MOSTLY_FALSE: 25.0,
-        ClaimRating.FALSE: 0.0,
-        ClaimRating.UNVERIFIABLE: 50.0,
-        ClaimRating.UNCERTAIN: 50.0
-    }
-    return scores.get(rating, 50.0)
+    return _RATING_SCORES.get(rating, 50.0)
 
 
+# Rating vocabulary used by normalize_rating
+_WORD_RE = re.compile(r'[a-z]+')
+_TRUE_WORDS = frozenset({'true', 'correct', 'accurate', 'verified'})
+_FALSE_WORDS = frozenset({'false', 'incorrect', 'inaccurate', 'debunked'})
+_HEDGE_WORDS = frozenset({'mostly', 'partially', 'somewhat'})
+_MIXED_WORDS = frozenset({'mixed', 'half', 'partly'})
+_UNVERIFIABLE_WORDS = frozenset({'unverifiable', 'unproven', 'inconclusive'})
+
+
+@lru_cache(maxsize=1024)
 def normalize_rating(raw_rating: str) -> ClaimRating:
     """Normalize various rating formats to standard ClaimRating.
 
+    Publishers reuse a small set of rating strings, so results are memoized.
+
     Args:
         raw_rating: Raw rating string from API
 
     Returns:
         Standardized ClaimRating
     """
-    rating_lower = raw_rating.lower().strip()
+    # Tokenize once, then use set intersections instead of substring scans
+    words = set(_WORD_RE.findall(raw_rating.lower()))
 
     # True variants
-    if any(word in rating_lower for word in ['true', 'correct', 'accurate', 'verified']):
-        if any(word in rating_lower for word in ['mostly', 'partially', 'somewhat']):
+    if words & _TRUE_WORDS:
+        if words & _HEDGE_WORDS:
             return ClaimRating.MOSTLY_TRUE
         return ClaimRating.TRUE
 
     # False variants
-    if any(word in rating_lower for word in ['false', 'incorrect', 'inaccurate', 'debunked']):
-        if any(word in rating_lower for word in ['mostly', 'partially', 'somewhat']):
+    if words & _FALSE_WORDS:
+        if words & _HEDGE_WORDS:
             return ClaimRating.MOSTLY_FALSE
         return ClaimRating.FALSE
 
     # Mixed/uncertain
-    if any(word in rating_lower for word in ['mixed', 'half', 'partly']):
+    if words & _MIXED_WORDS:
         return ClaimRating.MIXED
 
-    if any(word in rating_lower for word in ['unverifiable', 'unproven', 'inconclusive']):
+    if words & _UNVERIFIABLE_WORDS:
         return ClaimRating.UNVERIFIABLE
 
     # Default to uncertain
@@ -0,0 +1,128 @@
+"""Semantic cache for cloud API results.
+
+Near-duplicate phrasings of a claim ("the earth is flat" vs "Earth is flat!")
+usually get the same fact-check, so results are reused when the embedding of a
+new claim is close enough to one already verified.
+"""
+
+import math
+import re
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from cloud.response_models import CloudVerificationResult
+
+# Embeddings barely move when a claim is negated or a number changes ("X is
+# safe" vs "X is not safe", "3% of" vs "30% of"), yet the verdict flips, so
+# hits must also agree on both
+_TOKEN_RE = re.compile(r"[a-z]+(?:'t)?|\d+(?:[.,]\d+)*")
+_NEGATIONS = frozenset({
+    "not", "no", "never", "none", "nobody", "nothing", "neither", "nor",
+    "without", "cannot", "isn't", "aren't", "wasn't", "weren't", "don't",
+    "doesn't", "didn't", "won't", "can't", "hasn't", "haven't", "shouldn't"
+})
+
+
+def _claim_signature(claim: str) -> tuple:
+    """Reduce a claim to what similarity alone can't tell apart.
+
+    Args:
+        claim: Claim text
+
+    Returns:
+        (whether the claim is negated, sorted numbers in the claim)
+    """
+    tokens = _TOKEN_RE.findall(claim.lower().replace("\u2019", "'"))
+    negations = sum(1 for token in tokens if token in _NEGATIONS)
+    numbers = sorted(token.replace(",", "") for token in tokens if token[0].isdigit())
+    return negations % 2 == 1, numbers
+
+
+class SemanticResultCache:
+    """In-memory embedding-similarity cache for CloudVerificationResult."""
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], np.ndarray],
+        threshold: float = 0.92,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 1024
+    ):
+        """Initialize the cache.
+
+        Args:
+            encode: Function mapping a list of texts to an embedding matrix
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Time-to-live for each entry
+            max_entries: Maximum number of cached results (oldest evicted first)
+        """
+        self.encode = encode
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._vectors: List[np.ndarray] = []
+        self._results: List[CloudVerificationResult] = []
+        self._expires: List[float] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def embed(self, claim: str) -> np.ndarray:
+        """Embed and L2-normalize a claim.
+
+        Args:
+            claim: Claim text
+
+        Returns:
+            Unit-length embedding vector
+        """
+        vector = np.asarray(self.encode([claim])[0], dtype=np.float32)
+        norm = math.sqrt(float(np.vdot(vector, vector)))
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, vector: np.ndarray, claim: str) -> Optional[CloudVerificationResult]:
+        """Find a cached result for a similar claim.
+
+        Args:
+            vector: Normalized embedding from embed()
+            claim: Claim text the vector was embedded from
+
+        Returns:
+            Cached result or None if no fresh entry is similar enough, or the
+            closest one differs in negation or numbers
+        """
+        if not self._vectors:
+            return None
+
+        if self._matrix is None:
+            self._matrix = np.vstack(self._vectors)
+
+        similarities = self._matrix @ vector
+        best = int(np.argmax(similarities))
+
+        if similarities[best] < self.threshold or self._expires[best] < time.monotonic():
+            return None
+        result = self._results[best]
+        if _claim_signature(claim) != _claim_signature(result.claim):
+            return None
+        return result
+
+    def store(self, vector: np.ndarray, result: CloudVerificationResult):
+        """Cache a result under a claim embedding.
+
+        Args:
+            vector: Normalized embedding from embed()
+            result: Result to cache
+        """
+        now = time.monotonic()
+
+        # Drop expired entries, then the oldest ones if still over capacity
+        keep = [i for i, expires in enumerate(self._expires) if expires >= now]
+        keep = keep[-(self.max_entries - 1):] if self.max_entries > 1 else []
+        self._vectors = [self._vectors[i] for i in keep] + [vector]
+        self._results = [self._results[i] for i in keep] + [result]
+        self._expires = [self._expires[i] for i in keep] + [now + self.ttl_seconds]
+        self._matrix = None
+
+    def __len__(self) -> int:
+        return len(self._results)
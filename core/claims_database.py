@@ -3,9 +3,16 @@ Enhanced Claims Database
 Contains common misinformation and verified facts for local verification
 """
 
-from typing import Dict, List, Tuple
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
 from core.models import Verdict
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 class ClaimsDatabase:
     """Database of known claims with verdicts and evidence"""
 
@@ -194,39 +201,96 @@ class ClaimsDatabase:
         },
     }
 
+    # Read-only merged view of every bucket, in lookup priority order
+    # (FALSE, then TRUE, then MISLEADING)
+    ALL_CLAIMS = MappingProxyType({**FALSE_CLAIMS, **TRUE_CLAIMS, **MISLEADING_CLAIMS})
+
+    # (key, data) pairs in lookup priority order, built once on first search.
+    # _entries is published last, so a non-None value means the index is ready
+    _entries: Optional[List[Tuple[str, Dict]]] = None
+    _key_words: List[frozenset] = []
+    _word_index: Dict[str, Set[int]] = {}
+    _automaton = None
+    _index_lock = threading.Lock()
+
+    @classmethod
+    def _ensure_index(cls):
+        """Build the index on first use, once even across threads"""
+        if cls._entries is None:
+            with cls._index_lock:
+                if cls._entries is None:
+                    cls._build_index()
+
+    @classmethod
+    def _build_index(cls):
+        """Build the ordered key list and substring automaton"""
+        entries = list(cls.ALL_CLAIMS.items())
+
+        # Pre-split keys and map each word to the keys containing it
+        key_words = [frozenset(key.split()) for key, _ in entries]
+        word_index: Dict[str, Set[int]] = {}
+        for index, words in enumerate(key_words):
+            for word in words:
+                word_index.setdefault(word, set()).add(index)
+
+        automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for index, (key, _) in enumerate(entries):
+                automaton.add_word(key, index)
+            automaton.make_automaton()
+
+        cls._key_words = key_words
+        cls._word_index = word_index
+        cls._automaton = automaton
+        cls._entries = entries
+
+    @classmethod
+    def _substring_matches(cls, claim_lower: str) -> Set[int]:
+        """Indices of all keys occurring in the claim, found in one pass"""
+        if cls._automaton is not None:
+            return {index for _, index in cls._automaton.iter(claim_lower)}
+        return {index for index, (key, _) in enumerate(cls._entries) if key in claim_lower}
+
+    @classmethod
+    def find_contained(cls, text_lower: str) -> Set[str]:
+        """Keys of all known claims occurring in lowercased text, found in one pass"""
+        cls._ensure_index()
+        return {cls._entries[index][0] for index in cls._substring_matches(text_lower)}
+
     @classmethod
     def search(cls, claim: str) -> Tuple[bool, Dict]:
         """
         Search for a claim in the database
 
+        FALSE claims take priority over TRUE, then MISLEADING.
+
         Returns:
             (found, claim_data) tuple
         """
-        claim_lower = claim.lower().strip()
+        cls._ensure_index()
 
-        # Check FALSE claims
-        for key, data in cls.FALSE_CLAIMS.items():
-            if key in claim_lower or cls._fuzzy_match(key, claim_lower):
-                return True, data
+        claim_lower = claim.lower().strip()
+        claim_words = frozenset(claim_lower.split())
+        matches = cls._substring_matches(claim_lower)
 
-        # Check TRUE claims
-        for key, data in cls.TRUE_CLAIMS.items():
-            if key in claim_lower or cls._fuzzy_match(key, claim_lower):
-                return True, data
+        # Only keys sharing at least one word can pass the fuzzy threshold
+        candidates = set()
+        for word in claim_words:
+            candidates |= cls._word_index.get(word, set())
+        matches.update(
+            index for index in candidates - matches
+            if cls._fuzzy_match(cls._key_words[index], claim_words)
+        )
 
-        # Check MISLEADING claims
-        for key, data in cls.MISLEADING_CLAIMS.items():
-            if key in claim_lower or cls._fuzzy_match(key, claim_lower):
-                return True, data
+        if matches:
+            return True, cls._entries[min(matches)][1]
 
         return False, {}
 
     @classmethod
-    def _fuzzy_match(cls, key: str, claim: str, threshold: float = 0.8) -> bool:
+    def _fuzzy_match(cls, key_words: frozenset, claim_words: frozenset, threshold: float = 0.8) -> bool:
         """Simple fuzzy matching for variations"""
-        key_words = set(key.split())
-        claim_words = set(claim.split())
-
         if not key_words:
             return False
 
@@ -238,7 +302,7 @@ class ClaimsDatabase:
     def get_stats(cls) -> Dict:
         """Get database statistics"""
         return {
-            "total_claims": len(cls.FALSE_CLAIMS) + len(cls.TRUE_CLAIMS) + len(cls.MISLEADING_CLAIMS),
+            "total_claims": len(cls.ALL_CLAIMS),
             "false_claims": len(cls.FALSE_CLAIMS),
             "true_claims": len(cls.TRUE_CLAIMS),
             "misleading_claims": len(cls.MISLEADING_CLAIMS),
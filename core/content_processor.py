@@ -1,15 +1,155 @@
 """Content preprocessing and text extraction."""
 
 import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
 from dataclasses import dataclass
 
 from utils.logger import get_logger
 
-logger = get_logger(__name__)
+try:
+    import blingfire
+    BLINGFIRE_AVAILABLE = True
+except ImportError:
+    BLINGFIRE_AVAILABLE = False
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = get_logger(__name__)
 
-@dataclass
+# Fallback sentence boundary when blingfire isn't installed
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Markup _clean_text strips: HTML tags, URLs and email addresses
+_MARKUP_RE = re.compile(r'<[^>]+>|http[s]?://\S+|\S+@\S+')
+
+# Special characters _clean_text strips (punctuation kept)
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s.,!?;:\'\"-]')
+
+
+class _SpecialCharTable(dict):
+    """str.translate table deleting special characters.
+
+    Entries are filled in on first sight of each code point, so any Unicode
+    input is handled while the table stays as small as the text seen.
+    """
+
+    def __missing__(self, code_point: int) -> Optional[int]:
+        value = None if _SPECIAL_CHAR_RE.match(chr(code_point)) else code_point
+        self[code_point] = value
+        return value
+
+
+_SPECIAL_CHAR_TABLE = _SpecialCharTable()
+
+# Keywords that often indicate factual claims
+_CLAIM_INDICATORS = [
+    r'\d+%',  # Percentages
+    r'\d+\s+(?:billion|million|thousand)',  # Large numbers
+    r'(?:according to|study shows|research found|report states)',
+    r'(?:is|are|was|were)\s+(?:the|a)\s+',  # Definitive statements
+    r'(?:first|largest|biggest|most|least)',  # Superlatives
+    r'(?:every|all|no|none)',  # Absolutes
+    r'(?:cause|causes|caused)',  # Causation claims
+    r'(?:contain|contains)',  # Content claims
+]
+_CLAIM_INDICATOR_RE = re.compile('|'.join(f'(?:{p})' for p in _CLAIM_INDICATORS), re.IGNORECASE)
+
+# Claim-indicator presence check; Hyperscan compiles the patterns into one
+# DFA-style database when available
+if hyperscan is not None:
+    _CLAIM_INDICATOR_DB = hyperscan.Database()
+    _CLAIM_INDICATOR_DB.compile(
+        expressions=[pattern.encode('utf-8') for pattern in _CLAIM_INDICATORS],
+        ids=list(range(len(_CLAIM_INDICATORS))),
+        elements=len(_CLAIM_INDICATORS),
+        flags=[
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        ] * len(_CLAIM_INDICATORS)
+    )
+
+    def _has_claim_indicator(sentence: str) -> bool:
+        """Check for a claim indicator using the Hyperscan database."""
+        matched = []
+        _CLAIM_INDICATOR_DB.scan(
+            sentence.encode('utf-8'),
+            match_event_handler=lambda pattern_id, start, end, flags, context: matched.append(pattern_id)
+        )
+        return bool(matched)
+else:
+    def _has_claim_indicator(sentence: str) -> bool:
+        """Check for a claim indicator using the union regex."""
+        return _CLAIM_INDICATOR_RE.search(sentence) is not None
+
+# Phrases marking a sentence as personal opinion rather than a claim
+_OPINION_MARKERS = ('i think', 'i believe', 'in my opinion', 'i feel', 'seems like', 'maybe', 'perhaps')
+
+# All markers found in one scan of the sentence
+if ahocorasick is not None:
+    _OPINION_AUTOMATON = ahocorasick.Automaton()
+    for _marker in _OPINION_MARKERS:
+        _OPINION_AUTOMATON.add_word(_marker, _marker)
+    _OPINION_AUTOMATON.make_automaton()
+
+    def _has_opinion_marker(sentence_lower: str) -> bool:
+        """Check for an opinion marker using the automaton."""
+        return next(_OPINION_AUTOMATON.iter(sentence_lower), None) is not None
+else:
+    _OPINION_RE = re.compile('|'.join(re.escape(marker) for marker in _OPINION_MARKERS))
+
+    def _has_opinion_marker(sentence_lower: str) -> bool:
+        """Check for an opinion marker using the union regex."""
+        return _OPINION_RE.search(sentence_lower) is not None
+
+# Content features that raise claim complexity (plain substring matches)
+_NUMBER_RE = re.compile(r'\d')
+_SUPERLATIVE_RE = re.compile(r'biggest|largest|most|least|first|last|only', re.IGNORECASE)
+
+
+class SentenceFeatures(NamedTuple):
+    """Per-sentence features shared by claim extraction and strategy selection."""
+
+    has_claim_indicator: bool
+    has_number: bool
+    has_superlative: bool
+    has_opinion: bool
+    is_question: bool
+    word_count: int
+
+
+@lru_cache(maxsize=4096)
+def sentence_features(sentence: str) -> SentenceFeatures:
+    """Scan a sentence once for every feature the pipeline uses.
+
+    Memoized, so the decisor reads the features of extracted claims without
+    re-scanning them.
+
+    Args:
+        sentence: Sentence to scan
+
+    Returns:
+        SentenceFeatures for the sentence
+    """
+    return SentenceFeatures(
+        has_claim_indicator=_has_claim_indicator(sentence),
+        has_number=_NUMBER_RE.search(sentence) is not None,
+        has_superlative=_SUPERLATIVE_RE.search(sentence) is not None,
+        has_opinion=_has_opinion_marker(sentence.lower()),
+        is_question=sentence.rstrip().endswith('?'),
+        word_count=len(sentence.split())
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class ProcessedContent:
     """Processed content with metadata."""
 
@@ -80,7 +220,17 @@ class ContentProcessor:
             metadata=metadata
         )
 
-    def _clean_text(self, text: str) -> str:
+    def clear_caches(self):
+        """Drop memoized cleaning and claim-classification results."""
+        self._clean_text.cache_clear()
+        sentence_features.cache_clear()
+
+    # Pure functions of their input; reposts and templated content repeat
+    # the same text, so results are memoized (whole posts are larger, so
+    # fewer of them are kept)
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _clean_text(text: str) -> str:
         """Clean and normalize text.
 
         Args:
@@ -89,25 +239,14 @@ class ContentProcessor:
         Returns:
             Cleaned text
         """
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Remove URLs
-        text = re.sub(r'http[s]?://\S+', '', text)
-
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        # Remove HTML tags, URLs and emails
+        text = _MARKUP_RE.sub('', text)
 
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove special characters (per-character filter, so translate beats regex)
+        text = text.translate(_SPECIAL_CHAR_TABLE)
 
-        # Remove special characters but keep punctuation
-        text = re.sub(r'[^\w\s.,!?;:\'\"-]', '', text)
-
-        # Trim
-        text = text.strip()
-
-        return text
+        # Collapse whitespace and trim
+        return ' '.join(text.split())
 
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences.
@@ -118,8 +257,11 @@ class ContentProcessor:
         Returns:
             List of sentences
         """
-        # Simple sentence splitting (can be improved with spaCy or NLTK)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        if BLINGFIRE_AVAILABLE and text:
+            # Native segmenter; handles abbreviations and decimals too
+            sentences = blingfire.text_to_sentences(text).split('\n')
+        else:
+            sentences = _SENTENCE_SPLIT_RE.split(text)
 
         # Filter out very short sentences, but if input is short, keep the whole text
         filtered_sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
@@ -142,42 +284,27 @@ class ContentProcessor:
         Returns:
             List of potential claims
         """
-        claims = []
-
         # If no sentences extracted, treat empty as no claims
         if not sentences:
-            return claims
-
-        # Keywords that often indicate factual claims
-        claim_indicators = [
-            r'\d+%',  # Percentages
-            r'\d+\s+(billion|million|thousand)',  # Large numbers
-            r'(according to|study shows|research found|report states)',
-            r'(is|are|was|were)\s+(the|a)\s+',  # Definitive statements
-            r'(first|largest|biggest|most|least)',  # Superlatives
-            r'(every|all|no|none)',  # Absolutes
-            r'(cause|causes|caused)',  # Causation claims
-            r'(contain|contains)',  # Content claims
-        ]
+            return []
+
+        # Insertion-ordered dict as an ordered set: O(1) duplicate checks
+        claims: Dict[str, None] = {}
 
         for sentence in sentences:
-            # Check if sentence contains claim indicators
-            for indicator in claim_indicators:
-                if re.search(indicator, sentence, re.IGNORECASE):
-                    if sentence not in claims:
-                        claims.append(sentence)
-                    break
-
-            # Also include sentences with certain patterns
-            if self._is_likely_claim(sentence):
-                if sentence not in claims:
-                    claims.append(sentence)
+            if sentence in claims:
+                continue
+
+            # Claim indicators first, then the broader declarative check
+            if sentence_features(sentence).has_claim_indicator or self._is_likely_claim(sentence):
+                claims[sentence] = None
 
         self.logger.debug(f"Extracted {len(claims)} potential claims from {len(sentences)} sentences")
 
-        return claims
+        return list(claims)
 
-    def _is_likely_claim(self, sentence: str) -> bool:
+    @staticmethod
+    def _is_likely_claim(sentence: str) -> bool:
         """Check if a sentence is likely a factual claim.
 
         Args:
@@ -186,43 +313,20 @@ class ContentProcessor:
         Returns:
             True if likely a claim
         """
+        features = sentence_features(sentence)
+
         # Filter out questions
-        if sentence.strip().endswith('?'):
+        if features.is_question:
             return False
 
         # Filter out very short sentences
-        if len(sentence.split()) < 3:
+        if features.word_count < 3:
             return False
 
         # Filter out personal opinions
-        opinion_markers = ['i think', 'i believe', 'in my opinion', 'i feel', 'seems like', 'maybe', 'perhaps']
-        if any(marker in sentence.lower() for marker in opinion_markers):
+        if features.has_opinion:
             return False
 
-        # Most declarative sentences are potential claims
-        # Check for common verbs and structures
-        sentence_lower = sentence.lower()
-
-        # Factual verbs and patterns
-        factual_patterns = [
-            ' is ', ' are ', ' was ', ' were ',
-            ' has ', ' have ', ' had ',
-            ' will ', ' would ', ' should ',
-            ' can ', ' cannot ', ' can\'t ',
-            ' does ', ' do ', ' did ',
-            ' shows ', ' proves ', ' demonstrates ',
-            ' cause ', ' causes ', ' caused ',
-            ' contain ', ' contains ', ' contained ',
-            ' make ', ' makes ', ' made ',
-            ' create ', ' creates ', ' created ',
-            ' lead ', ' leads ', ' led ',
-            'don\'t ', 'doesn\'t ', 'didn\'t ',
-            'won\'t ', 'wouldn\'t ', 'shouldn\'t ',
-        ]
-
-        if any(pattern in sentence_lower for pattern in factual_patterns):
-            return True
-
-        # If we got here, it's probably still a claim (be inclusive)
+        # Most declarative sentences are potential claims (be inclusive).
         # Better to over-identify than miss claims
         return True
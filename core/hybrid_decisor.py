@@ -2,8 +2,9 @@
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
+from core.content_processor import sentence_features
 from utils.config import settings
 from utils.logger import get_logger
 
@@ -18,14 +19,31 @@ class VerificationStrategy(Enum):
     HYBRID = "hybrid"  # Balanced, using both local and cloud
 
 
-@dataclass
+# Short strategy names accepted from the API, CLI and extension
+STRATEGY_BY_NAME = {
+    "local": VerificationStrategy.LOCAL_ONLY,
+    "cloud": VerificationStrategy.CLOUD_ONLY,
+    "hybrid": VerificationStrategy.HYBRID
+}
+
+# Estimated verification time in seconds per strategy
+_TIME_ESTIMATES = {
+    VerificationStrategy.LOCAL_ONLY: 1.5,
+    VerificationStrategy.CLOUD_ONLY: 10.0,
+    VerificationStrategy.HYBRID: 5.0
+}
+
+
+@dataclass(slots=True)
 class DecisionFactors:
     """Factors used to decide verification strategy."""
 
     claim_complexity: float  # 0.0 to 1.0, higher is more complex
     claim_count: int
-    has_numbers: bool  # Statistical claims need more verification
-    has_superlatives: bool  # "largest", "first", etc.
+    # Content features; None when not scanned because the decision was
+    # already settled by claim count/complexity
+    has_numbers: Optional[bool]  # Statistical claims need more verification
+    has_superlatives: Optional[bool]  # "largest", "first", etc.
     content_length: int
     cache_available: bool
     cloud_apis_available: bool
@@ -38,6 +56,11 @@ class HybridDecisor:
     def __init__(self):
         """Initialize the hybrid decisor."""
         self.logger = logger
+        self.refresh()
+
+    def refresh(self):
+        """Re-read cloud availability from settings (call after changing them)."""
+        self._cloud_available = settings.has_cloud_apis() and not settings.local_only_mode
 
     def decide(
         self,
@@ -62,8 +85,8 @@ class HybridDecisor:
             self.logger.info("Using cached result, skipping verification")
             return VerificationStrategy.LOCAL_ONLY
 
-        # Check if cloud APIs are available
-        cloud_available = settings.has_cloud_apis() and not settings.local_only_mode
+        # Check if cloud APIs are available (snapshotted from settings)
+        cloud_available = self._cloud_available
 
         # If user prefers local only or cloud APIs not available
         if not cloud_available or user_preference == VerificationStrategy.LOCAL_ONLY:
@@ -110,31 +133,37 @@ class HybridDecisor:
 
         # Calculate complexity (0.0 to 1.0)
         complexity = 0.0
+        has_numbers: Optional[bool] = False
+        has_superlatives: Optional[bool] = False
 
         if claim_count > 0:
             # More claims = higher complexity
             complexity += min(claim_count / 10, 0.3)
 
+            # Claims come from the content processor, so their features are cached
+            features = [sentence_features(claim) for claim in claims]
+
             # Longer claims = higher complexity
-            avg_claim_length = sum(len(c.split()) for c in claims) / claim_count
+            avg_claim_length = sum(f.word_count for f in features) / claim_count
             complexity += min(avg_claim_length / 50, 0.3)
 
-            # Check for numbers, percentages, dates
-            has_numbers = any(
-                any(char.isdigit() for char in claim)
-                for claim in claims
-            )
-            if has_numbers:
-                complexity += 0.2
-
-            # Check for superlatives (biggest, first, most, etc.)
-            superlatives = ['biggest', 'largest', 'most', 'least', 'first', 'last', 'only']
-            has_superlatives = any(
-                any(word in claim.lower() for word in superlatives)
-                for claim in claims
-            )
-            if has_superlatives:
-                complexity += 0.2
+            if claim_count > 5:
+                # Many claims picks the strategy on its own
+                has_numbers = has_superlatives = None
+            else:
+                # Check for numbers, percentages, dates
+                has_numbers = any(f.has_number for f in features)
+                if has_numbers:
+                    complexity += 0.2
+
+                if complexity > 0.6:
+                    # Already high complexity; superlatives can't change the outcome
+                    has_superlatives = None
+                else:
+                    # Check for superlatives (biggest, first, most, etc.)
+                    has_superlatives = any(f.has_superlative for f in features)
+                    if has_superlatives:
+                        complexity += 0.2
 
         # Cap at 1.0
         complexity = min(complexity, 1.0)
@@ -142,8 +171,8 @@ class HybridDecisor:
         return DecisionFactors(
             claim_complexity=complexity,
             claim_count=claim_count,
-            has_numbers=has_numbers if claim_count > 0 else False,
-            has_superlatives=has_superlatives if claim_count > 0 else False,
+            has_numbers=has_numbers,
+            has_superlatives=has_superlatives,
             content_length=content_length,
             cache_available=False,
             cloud_apis_available=cloud_apis_available,
@@ -190,9 +219,4 @@ class HybridDecisor:
         Returns:
             Estimated time in seconds
         """
-        estimates = {
-            VerificationStrategy.LOCAL_ONLY: 1.5,
-            VerificationStrategy.CLOUD_ONLY: 10.0,
-            VerificationStrategy.HYBRID: 5.0
-        }
-        return estimates.get(strategy, 2.0)
+        return _TIME_ESTIMATES.get(strategy, 2.0)
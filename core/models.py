@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
 
+import orjson
+
 from core.hybrid_decisor import VerificationStrategy
 
 
@@ -17,8 +19,11 @@ class Verdict(Enum):
     UNVERIFIABLE = "UNVERIFIABLE"
     UNCERTAIN = "UNCERTAIN"
 
+    # Identity hash in C, like ClaimRating
+    __hash__ = object.__hash__
+
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of content verification."""
 
@@ -45,3 +50,21 @@ class VerificationResult:
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata
         }
+
+    def to_json(self) -> bytes:
+        """Serialize result to JSON bytes, with the same shape as to_dict().
+
+        orjson encodes the enums and the timestamp natively, so no
+        intermediate value/isoformat strings are built.
+        """
+        return orjson.dumps({
+            "verdict": self.verdict,
+            "confidence": round(self.confidence, 2),
+            "explanation": self.explanation,
+            "sources": self.sources,
+            "evidence": self.evidence,
+            "strategy": self.strategy_used,
+            "processing_time": round(self.processing_time, 3),
+            "timestamp": self.timestamp,
+            "metadata": self.metadata
+        })
@@ -10,6 +10,37 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Map ClaimRating to Verdict
+_RATING_TO_VERDICT = {
+    ClaimRating.TRUE: Verdict.TRUE,
+    ClaimRating.MOSTLY_TRUE: Verdict.TRUE,
+    ClaimRating.MIXED: Verdict.MISLEADING,
+    ClaimRating.MOSTLY_FALSE: Verdict.MISLEADING,
+    ClaimRating.FALSE: Verdict.FALSE,
+    ClaimRating.UNVERIFIABLE: Verdict.UNVERIFIABLE,
+    ClaimRating.UNCERTAIN: Verdict.UNCERTAIN
+}
+
+# How the explanation describes each final verdict
+_VERDICT_TEXT = {
+    Verdict.TRUE: "supports this claim",
+    Verdict.FALSE: "contradicts this claim",
+    Verdict.MISLEADING: "finds this claim partially accurate but misleading",
+    Verdict.UNVERIFIABLE: "cannot verify this claim",
+    Verdict.UNCERTAIN: "provides mixed assessments of this claim"
+}
+
+# Which per-claim verdict decides a multi-claim verdict, lowest first: one
+# false claim outweighs any number of true ones, and uninformative verdicts
+# only win when no claim got a rating
+_VERDICT_PRIORITY = {
+    Verdict.FALSE: 0,
+    Verdict.MISLEADING: 1,
+    Verdict.TRUE: 2,
+    Verdict.UNVERIFIABLE: 3,
+    Verdict.UNCERTAIN: 4
+}
+
 
 class ResultAggregator:
     """Aggregates results from multiple verification sources."""
@@ -35,28 +66,38 @@ class ResultAggregator:
         if not results:
             return self._create_no_results_verdict(original_claim)
 
-        # Extract ratings and scores
-        ratings = [r.rating for r in results]
-        confidences = [r.confidence for r in results]
-        all_sources = []
+        # Extract ratings, scores, sources and evidence in one pass
+        ratings = []
+        confidences = []
+        source_names = set()
+        api_names = set()
         all_evidence = []
+        total_sources = 0
 
         for result in results:
-            all_sources.extend([s.name for s in result.sources])
+            ratings.append(result.rating)
+            confidences.append(result.confidence)
+            api_names.add(result.api_name)
+            total_sources += len(result.sources)
+            source_names.update(s.name for s in result.sources)
             if result.explanation:
                 all_evidence.append(f"[{result.api_name}] {result.explanation}")
 
+        # Count ratings once; every helper below works from the counts
+        rating_counts = Counter(ratings)
+        top_rating, top_count = rating_counts.most_common(1)[0]
+
         # Determine consensus verdict
-        verdict = self._determine_verdict(ratings)
+        verdict = self._determine_verdict(rating_counts, top_rating, len(ratings))
 
         # Calculate aggregated confidence
-        confidence = self._calculate_aggregated_confidence(ratings, confidences)
+        confidence = self._calculate_aggregated_confidence(top_count, confidences)
 
         # Generate explanation
-        explanation = self._generate_explanation(results, verdict)
+        explanation = self._generate_explanation(len(api_names), verdict, total_sources)
 
         # Get unique sources
-        unique_sources = list(set(all_sources))
+        unique_sources = list(source_names)
 
         return VerificationResult(
             verdict=verdict,
@@ -68,123 +109,129 @@ class ResultAggregator:
             processing_time=0.0,  # Will be set by engine
             timestamp=datetime.now(),
             metadata={
-                "api_count": len(results),
+                "api_count": len(api_names),
                 "source_count": len(unique_sources),
-                "rating_distribution": self._get_rating_distribution(ratings)
+                "rating_distribution": self._get_rating_distribution(rating_counts)
             }
         )
 
-    def _determine_verdict(self, ratings: List[ClaimRating]) -> Verdict:
-        """Determine final verdict from multiple ratings.
+    def combine_claim_results(self, claim_results: Dict[str, VerificationResult]) -> VerificationResult:
+        """Combine per-claim results into a single verdict for the content.
+
+        The worst verdict wins (ties go to the more confident claim). Sources
+        and evidence of every claim are kept, and each claim's own verdict is
+        listed under ``metadata["claims"]``.
 
         Args:
-            ratings: List of ratings from different sources
+            claim_results: Aggregated result per claim, in claim order
 
         Returns:
-            Final Verdict
+            Combined VerificationResult
         """
-        if not ratings:
-            return Verdict.UNCERTAIN
+        if len(claim_results) == 1:
+            return next(iter(claim_results.values()))
 
-        # Count ratings
-        rating_counts = Counter(ratings)
-        most_common_rating = rating_counts.most_common(1)[0][0]
+        worst = min(
+            claim_results.values(),
+            key=lambda r: (_VERDICT_PRIORITY[r.verdict], -r.confidence)
+        )
+
+        return VerificationResult(
+            verdict=worst.verdict,
+            confidence=worst.confidence,
+            explanation=f"{worst.explanation.rstrip('.')} (worst of {len(claim_results)} claims checked).",
+            sources=list(dict.fromkeys(s for r in claim_results.values() for s in r.sources)),
+            evidence=[e for r in claim_results.values() for e in r.evidence],
+            strategy_used=None,  # Will be set by engine
+            processing_time=0.0,  # Will be set by engine
+            timestamp=datetime.now(),
+            metadata={
+                **worst.metadata,
+                "claims": [
+                    {"claim": claim, "verdict": r.verdict.value, "confidence": round(r.confidence, 2)}
+                    for claim, r in claim_results.items()
+                ]
+            }
+        )
+
+    def _determine_verdict(self, rating_counts: Counter, top_rating: ClaimRating, total: int) -> Verdict:
+        """Determine final verdict from multiple ratings.
 
-        # Map ClaimRating to Verdict
-        rating_map = {
-            ClaimRating.TRUE: Verdict.TRUE,
-            ClaimRating.MOSTLY_TRUE: Verdict.TRUE,
-            ClaimRating.MIXED: Verdict.MISLEADING,
-            ClaimRating.MOSTLY_FALSE: Verdict.MISLEADING,
-            ClaimRating.FALSE: Verdict.FALSE,
-            ClaimRating.UNVERIFIABLE: Verdict.UNVERIFIABLE,
-            ClaimRating.UNCERTAIN: Verdict.UNCERTAIN
-        }
+        Args:
+            rating_counts: Number of results per rating
+            top_rating: Most common rating
+            total: Number of ratings
 
-        verdict = rating_map.get(most_common_rating, Verdict.UNCERTAIN)
+        Returns:
+            Final Verdict
+        """
+        if not total:
+            return Verdict.UNCERTAIN
 
         # If ratings are split, mark as uncertain
-        if len(rating_counts) >= 3 and len(ratings) >= 3:
+        if len(rating_counts) >= 3 and total >= 3:
             # Too much disagreement
             return Verdict.UNCERTAIN
 
-        return verdict
+        return _RATING_TO_VERDICT.get(top_rating, Verdict.UNCERTAIN)
 
-    def _calculate_aggregated_confidence(
-        self,
-        ratings: List[ClaimRating],
-        confidences: List[float]
-    ) -> float:
+    def _calculate_aggregated_confidence(self, top_count: int, confidences: List[float]) -> float:
         """Calculate aggregated confidence score.
 
         Args:
-            ratings: List of ratings
+            top_count: Number of results sharing the most common rating
             confidences: List of confidence scores
 
         Returns:
             Aggregated confidence (0-100)
         """
-        if not ratings:
+        if not confidences:
             return 0.0
 
+        total = len(confidences)
+
         # Base confidence on average
-        avg_confidence = sum(confidences) / len(confidences)
+        avg_confidence = sum(confidences) / total
 
         # Bonus for agreement
-        rating_counts = Counter(ratings)
-        agreement_ratio = rating_counts.most_common(1)[0][1] / len(ratings)
+        agreement_ratio = top_count / total
 
         agreement_bonus = (agreement_ratio - 0.5) * 40  # Up to +20% for full agreement
 
         # Bonus for multiple sources
-        source_bonus = min(len(ratings) * 5, 15)
+        source_bonus = min(total * 5, 15)
 
         total_confidence = avg_confidence + agreement_bonus + source_bonus
 
         return min(max(total_confidence, 0.0), 100.0)
 
-    def _generate_explanation(
-        self,
-        results: List[CloudVerificationResult],
-        verdict: Verdict
-    ) -> str:
+    def _generate_explanation(self, api_count: int, verdict: Verdict, total_sources: int) -> str:
         """Generate human-readable explanation.
 
         Args:
-            results: Cloud verification results
+            api_count: Number of services that returned a result
             verdict: Final verdict
+            total_sources: Number of sources cited across all results
 
         Returns:
             Explanation text
         """
-        api_count = len(results)
-        total_sources = sum(len(r.sources) for r in results)
-
-        verdict_text = {
-            Verdict.TRUE: "supports this claim",
-            Verdict.FALSE: "contradicts this claim",
-            Verdict.MISLEADING: "finds this claim partially accurate but misleading",
-            Verdict.UNVERIFIABLE: "cannot verify this claim",
-            Verdict.UNCERTAIN: "provides mixed assessments of this claim"
-        }
-
-        base = f"Analysis from {api_count} fact-checking service(s) {verdict_text.get(verdict, 'analyzed this claim')}"
+        base = f"Analysis from {api_count} fact-checking service(s) {_VERDICT_TEXT.get(verdict, 'analyzed this claim')}"
 
         if total_sources > 0:
             return f"{base}, citing {total_sources} source(s)."
         else:
             return f"{base}."
 
-    def _get_rating_distribution(self, ratings: List[ClaimRating]) -> Dict[str, int]:
+    def _get_rating_distribution(self, rating_counts: Counter) -> Dict[str, int]:
         """Get distribution of ratings.
 
         Args:
-            ratings: List of ratings
+            rating_counts: Number of results per rating
 
         Returns:
             Dictionary of rating counts
         """
-        rating_counts = Counter(ratings)
         return {rating.value: count for rating, count in rating_counts.items()}
 
     def _create_no_results_verdict(self, claim: str) -> VerificationResult:
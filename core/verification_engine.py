@@ -1,6 +1,10 @@
 """Main verification engine that orchestrates the verification process."""
 
-from typing import Optional
+import asyncio
+import time
+from dataclasses import replace
+from functools import cached_property
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from core.models import Verdict, VerificationResult
@@ -9,15 +13,40 @@ from core.hybrid_decisor import HybridDecisor, VerificationStrategy
 from core.result_aggregator import ResultAggregator
 from core.claims_database import ClaimsDatabase
 from model.semantic_classifier import get_semantic_classifier
+from cloud.base_client import BaseAPIClient, ResultCache
 from cloud.google_factcheck import GoogleFactCheckClient
 from cloud.claimbuster import ClaimBusterClient
 from cloud.factiverse import FactiverseClient
+from cloud.response_models import CloudVerificationResult
 from storage.cache import cache
 from utils.config import settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cache TTLs in seconds, by how stable a verdict is expected to be
+_TTL_SETTLED = 7 * 86400  # Confident TRUE/FALSE
+_TTL_UNCERTAIN = 3600  # Requery soon once sources have data
+_TTL_DEFAULT = 86400
+# No source had a result; kept short since a transient failure looks the same
+_TTL_NEGATIVE = 900
+
+
+def _cache_ttl(result: VerificationResult) -> int:
+    """Pick a cache TTL for a verification result.
+
+    Args:
+        result: Verification result about to be cached
+
+    Returns:
+        Time to live in seconds
+    """
+    if result.confidence >= 90 and result.verdict in (Verdict.TRUE, Verdict.FALSE):
+        return _TTL_SETTLED
+    if result.verdict in (Verdict.UNCERTAIN, Verdict.UNVERIFIABLE):
+        return _TTL_UNCERTAIN
+    return _TTL_DEFAULT
+
 
 class VerificationEngine:
     """Main engine for content verification."""
@@ -32,15 +61,50 @@ class VerificationEngine:
         # Initialize semantic classifier for ML-powered matching
         self.semantic_classifier = get_semantic_classifier()
 
-        # Initialize cloud API clients
-        self.google_client = GoogleFactCheckClient()
-        self.claimbuster_client = ClaimBusterClient()
-        self.factiverse_client = FactiverseClient()
+        # Cloud configuration is fixed at runtime; resolve it once. The
+        # clients themselves are created on first use (see cloud_clients)
+        self._has_cloud_apis = settings.has_cloud_apis()
+
+        # Verification coroutine per strategy
+        self._strategy_handlers = {
+            VerificationStrategy.LOCAL_ONLY: self._verify_local,
+            VerificationStrategy.CLOUD_ONLY: self._verify_cloud,
+            VerificationStrategy.HYBRID: self._verify_hybrid
+        }
+
+        # Bound how long any one provider can hold up a verification (each
+        # client caps its own concurrent HTTP requests)
+        self._cloud_timeout = settings.cloud_timeout_seconds
 
         # Log model info
         model_info = self.semantic_classifier.get_model_info()
         self.logger.info(f"VerificationEngine initialized with semantic classifier: {model_info}")
 
+    @cached_property
+    def google_client(self) -> GoogleFactCheckClient:
+        """Google Fact Check client, created on first use."""
+        return GoogleFactCheckClient()
+
+    @cached_property
+    def claimbuster_client(self) -> ClaimBusterClient:
+        """ClaimBuster client, created on first use."""
+        return ClaimBusterClient()
+
+    @cached_property
+    def factiverse_client(self) -> FactiverseClient:
+        """Factiverse client, created on first use."""
+        return FactiverseClient()
+
+    @cached_property
+    def cloud_clients(self) -> Tuple[BaseAPIClient, ...]:
+        """All cloud API clients."""
+        return (self.google_client, self.claimbuster_client, self.factiverse_client)
+
+    @cached_property
+    def _configured_clients(self) -> Tuple[BaseAPIClient, ...]:
+        """Cloud API clients that have an API key."""
+        return tuple(c for c in self.cloud_clients if c.is_configured)
+
     async def verify(
         self,
         text: str,
@@ -61,17 +125,35 @@ class VerificationEngine:
         Returns:
             VerificationResult with verdict and details
         """
-        start_time = datetime.now()
+        # Monotonic clock for the duration; datetime is only for timestamps
+        start_time = time.perf_counter()
         self.logger.info(f"Starting verification for content from {platform or 'unknown'}")
 
         try:
             # Step 1: Check cache first
             cached_result = cache.get(text)
+            if cached_result is None and cache.is_negative(text, user_preference.value):
+                self.logger.info("No results for this text recently, skipping sources")
+                return VerificationResult(
+                    verdict=Verdict.UNCERTAIN,
+                    confidence=0.0,
+                    explanation="No fact-checking results available (checked recently).",
+                    sources=[],
+                    evidence=[],
+                    strategy_used=user_preference,
+                    processing_time=time.perf_counter() - start_time,
+                    timestamp=datetime.now(),
+                    metadata={"url": url, "platform": platform, "author": author, "negative_cache": True}
+                )
             if cached_result is not None:
                 self.logger.info("Using cached result")
-                # Update processing time
-                cached_result.processing_time = (datetime.now() - start_time).total_seconds()
-                return cached_result
+                # Return a copy with this request's timing and source context
+                # rather than mutating the cached object
+                return replace(
+                    cached_result,
+                    processing_time=time.perf_counter() - start_time,
+                    metadata={**cached_result.metadata, "url": url, "platform": platform, "author": author}
+                )
 
             # Step 2: Process content
             processed_content = self.content_processor.process(
@@ -89,21 +171,23 @@ class VerificationEngine:
                 user_preference=user_preference
             )
 
-            # Step 4: Perform verification based on strategy
-            if strategy == VerificationStrategy.LOCAL_ONLY:
-                result = await self._verify_local(processed_content)
-            elif strategy == VerificationStrategy.CLOUD_ONLY:
-                result = await self._verify_cloud(processed_content)
-            else:  # HYBRID
-                result = await self._verify_hybrid(processed_content)
+            # Step 4: Perform verification based on strategy (hybrid by default)
+            handler = self._strategy_handlers.get(strategy, self._verify_hybrid)
+            result = await handler(processed_content)
 
             # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             result.processing_time = processing_time
             result.strategy_used = strategy
 
-            # Cache the result
-            cache.set(text, result)
+            # Cache the result. An UNCERTAIN 0% result means no source had
+            # one: remember that briefly for this strategy, unless a source
+            # failed or timed out (worth retrying right away)
+            if result.verdict == Verdict.UNCERTAIN and result.confidence == 0.0:
+                if not result.metadata.get("cloud_failures"):
+                    cache.set_negative(text, user_preference.value, ttl=_TTL_NEGATIVE)
+            else:
+                cache.set(text, result, ttl=_cache_ttl(result))
 
             self.logger.info(
                 f"Verification complete: {result.verdict.value} "
@@ -116,7 +200,7 @@ class VerificationEngine:
             self.logger.error(f"Verification failed: {e}", exc_info=True)
 
             # Return uncertain result on error
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             return VerificationResult(
                 verdict=Verdict.UNCERTAIN,
                 confidence=0.0,
@@ -132,6 +216,17 @@ class VerificationEngine:
     async def _verify_local(self, content) -> VerificationResult:
         """Perform local verification using claims database and semantic matching.
 
+        Args:
+            content: Processed content
+
+        Returns:
+            Verification result
+        """
+        return self._verify_local_sync(content)
+
+    def _verify_local_sync(self, content) -> VerificationResult:
+        """Local verification body; synchronous so it can run in a worker thread.
+
         Args:
             content: Processed content
 
@@ -154,8 +249,13 @@ class VerificationEngine:
                 metadata=content.metadata
             )
 
+        # Semantic matches for the claims, classified in one batch the first
+        # time a claim misses the database
+        semantic_matches = None
+        semantic_start = 0
+
         # Try each claim
-        for claim in content.claims:
+        for index, claim in enumerate(content.claims):
             # STEP 1: Try exact/fuzzy database matching first (fastest)
             found, claim_data = ClaimsDatabase.search(claim)
 
@@ -174,7 +274,10 @@ class VerificationEngine:
                 )
 
             # STEP 2: Try semantic similarity matching (ML-powered)
-            semantic_match = self.semantic_classifier.classify_claim(claim)
+            if semantic_matches is None:
+                semantic_start = index
+                semantic_matches = self.semantic_classifier.classify_claims(content.claims[index:])
+            semantic_match = semantic_matches[index - semantic_start]
 
             if semantic_match and semantic_match.similarity >= 0.65:
                 self.logger.info(
@@ -232,7 +335,7 @@ class VerificationEngine:
         """
         self.logger.debug("Running cloud verification")
 
-        if not settings.has_cloud_apis():
+        if not self._has_cloud_apis:
             self.logger.warning("No cloud APIs configured")
             return VerificationResult(
                 verdict=Verdict.UNCERTAIN,
@@ -246,20 +349,13 @@ class VerificationEngine:
                 metadata=content.metadata
             )
 
-        # Use the best claim or the cleaned text
-        claim_to_verify = content.claims[0] if content.claims else content.cleaned_text
+        # Verify every claim (or the cleaned text when none were extracted)
+        claims_to_verify = list(dict.fromkeys(content.claims)) or [content.cleaned_text]
 
-        # Call all configured cloud APIs in parallel
-        import asyncio
-        cloud_results = []
-
-        tasks = []
-        if self.google_client.is_configured:
-            tasks.append(self.google_client.verify_claim(claim_to_verify))
-        if self.claimbuster_client.is_configured:
-            tasks.append(self.claimbuster_client.verify_claim(claim_to_verify))
-        if self.factiverse_client.is_configured:
-            tasks.append(self.factiverse_client.verify_claim(claim_to_verify))
+        # Call all configured cloud APIs in parallel, each batching the claims
+        # with its own per-claim timeout; failed claims are collected
+        failures: List[str] = []
+        tasks = [self._bounded(client, claims_to_verify, failures) for client in self._configured_clients]
 
         if not tasks:
             return VerificationResult(
@@ -277,22 +373,58 @@ class VerificationEngine:
         # Run API calls in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Filter out None and exceptions
-        for result in results:
-            if result is not None and not isinstance(result, Exception):
-                cloud_results.append(result)
-
-        # Aggregate results
-        aggregated = self.result_aggregator.aggregate_cloud_results(
-            cloud_results,
-            claim_to_verify
-        )
+        # Group results by the claim they answer, skipping failed clients
+        results_by_claim = {ResultCache.make_key(claim): [] for claim in claims_to_verify}
+        for client_results in results:
+            if isinstance(client_results, Exception):
+                self.logger.warning(f"Cloud provider failed: {client_results!r}")
+                failures.extend(claims_to_verify)
+                continue
+            for cloud_result in client_results:
+                claim_results = results_by_claim.get(ResultCache.make_key(cloud_result.claim))
+                if claim_results is not None:
+                    claim_results.append(cloud_result)
+
+        # Aggregate each claim's results, then combine the claims
+        aggregated = self.result_aggregator.combine_claim_results({
+            claim: self.result_aggregator.aggregate_cloud_results(
+                results_by_claim[ResultCache.make_key(claim)],
+                claim
+            )
+            for claim in claims_to_verify
+        })
 
         # Add content metadata
         aggregated.metadata.update(content.metadata)
+        aggregated.metadata["cloud_failures"] = len(failures)
 
         return aggregated
 
+    async def _bounded(
+        self,
+        client: BaseAPIClient,
+        claims: List[str],
+        failures: List[str]
+    ) -> List[CloudVerificationResult]:
+        """Verify claims with one provider, bounded by the cloud timeout.
+
+        The timeout applies to each claim and to the provider call as a
+        whole, so a verification never waits much longer than it on any
+        provider however many claims it has.
+
+        Args:
+            client: Cloud API client
+            claims: Claims to verify
+            failures: Claims that timed out or raised are appended here
+
+        Returns:
+            The provider's results (raises TimeoutError past the timeout)
+        """
+        return await asyncio.wait_for(
+            client.verify_claims(claims, timeout=self._cloud_timeout, failures=failures),
+            self._cloud_timeout
+        )
+
     async def _verify_hybrid(self, content) -> VerificationResult:
         """Perform hybrid verification using both local and cloud.
 
@@ -304,22 +436,31 @@ class VerificationEngine:
         """
         self.logger.debug("Running hybrid verification")
 
-        # Run local verification first (fast)
-        local_result = await self._verify_local(content)
+        # Start cloud verification speculatively (if available) and run the
+        # CPU-bound local pass in a worker thread, so the event loop keeps
+        # driving the cloud API calls meanwhile
+        cloud_task = None
+        if self._has_cloud_apis:
+            cloud_task = asyncio.create_task(self._verify_cloud(content))
+
+        local_result = await asyncio.to_thread(self._verify_local_sync, content)
 
         # If local is highly confident, return it
         if local_result.confidence > 90.0:
             self.logger.debug("Local verification highly confident, skipping cloud")
+            if cloud_task is not None:
+                cloud_task.cancel()
             return local_result
 
-        # Otherwise, also check cloud (if available)
-        if settings.has_cloud_apis():
-            cloud_result = await self._verify_cloud(content)
-
-            # Combine results
-            # TODO: Implement proper result aggregation
-            # For now, just return cloud result
-            return cloud_result
+        # Otherwise, use the cloud result (if available)
+        if cloud_task is not None:
+            try:
+                # Combine results
+                # TODO: Implement proper result aggregation
+                # For now, just return cloud result
+                return await cloud_task
+            except Exception as e:
+                self.logger.warning(f"Cloud verification failed, using local result: {e}")
 
         # Fall back to local if cloud unavailable
         return local_result
@@ -10,16 +10,144 @@ Supported datasets:
 - Custom datasets from cloud APIs
 """
 
-import json
+import mmap
 import os
-from typing import List, Dict, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
 from pathlib import Path
 
+import orjson
+
 from utils.logger import get_logger
 from core.models import Verdict
 
 logger = get_logger(__name__)
 
+# FEVER label -> (verdict, confidence); anything else is NOT ENOUGH INFO
+_FEVER_MAP = {
+    "SUPPORTS": (Verdict.TRUE, 85.0),
+    "REFUTES": (Verdict.FALSE, 85.0)
+}
+_FEVER_DEFAULT = (Verdict.UNCERTAIN, 50.0)
+
+# Per-row strings and lists that don't depend on the row, built once and
+# shared (treat as read-only)
+_FEVER_EXPLANATIONS = {
+    verdict: f"This claim was verified against Wikipedia evidence and found to be {verdict.value.lower()}."
+    for verdict, _ in (*_FEVER_MAP.values(), _FEVER_DEFAULT)
+}
+_FEVER_DEFAULT_EVIDENCE = ("Verified via Wikipedia fact-checking",)
+_FEVER_SOURCES = ("FEVER Dataset", "Wikipedia")
+
+# LIAR labels: 0=pants-fire, 1=false, 2=barely-true, 3=half-true, 4=mostly-true, 5=true
+_LIAR_LABELS = ("pants-fire", "false", "barely-true", "half-true", "mostly-true", "true")
+_LIAR_MAP = {
+    0: (Verdict.FALSE, 90.0),
+    1: (Verdict.FALSE, 85.0),
+    2: (Verdict.MISLEADING, 70.0),
+    3: (Verdict.MISLEADING, 70.0),
+    4: (Verdict.TRUE, 70.0),
+    5: (Verdict.TRUE, 80.0)
+}
+_LIAR_EXPLANATIONS = tuple(
+    f"This claim was fact-checked by PolitiFact and rated as '{label_text}'."
+    for label_text in _LIAR_LABELS
+)
+_LIAR_DEFAULT_EVIDENCE = ("Verified via PolitiFact",)
+_LIAR_SOURCES = ("LIAR Dataset", "PolitiFact")
+
+
+def _iter_fever_claims(dataset: Iterable[Dict]) -> Iterator[Dict]:
+    """Convert FEVER rows to claim dictionaries, skipping unusable rows
+
+    Args:
+        dataset: Iterable of raw dataset rows
+
+    Yields:
+        Claim dictionaries with verdict and evidence
+    """
+    for item in dataset:
+        # Rows always carry these keys; skip malformed ones
+        try:
+            # Filter short claims before any label work
+            claim_text = item["claim"].strip()
+            if len(claim_text) < 10:
+                continue
+
+            # Convert FEVER label to our verdict system
+            verdict, confidence = _FEVER_MAP.get(item["label"], _FEVER_DEFAULT)
+            evidence_items = item["evidence_annotation_id"]
+        except KeyError:
+            continue
+
+        # Build evidence from Wikipedia evidence sentences
+        if evidence_items:
+            evidence = [f"Evidence from {len(evidence_items)} Wikipedia source(s)"]
+        else:
+            evidence = _FEVER_DEFAULT_EVIDENCE
+
+        yield {
+            "claim": claim_text,
+            "verdict": verdict,
+            "confidence": confidence,
+            "explanation": _FEVER_EXPLANATIONS[verdict],
+            "evidence": evidence,
+            "sources": _FEVER_SOURCES,
+            "dataset": "FEVER"
+        }
+
+
+def _iter_liar_claims(dataset: Iterable[Dict]) -> Iterator[Dict]:
+    """Convert LIAR rows to claim dictionaries, skipping unusable rows
+
+    Args:
+        dataset: Iterable of raw dataset rows
+
+    Yields:
+        Claim dictionaries with verdict and evidence
+    """
+    for item in dataset:
+        # Rows always carry these keys; skip malformed ones
+        try:
+            # Filter short claims before any label work
+            claim_text = item["statement"].strip()
+            if len(claim_text) < 10:
+                continue
+
+            # Convert LIAR label to our verdict system
+            label = item["label"]
+            mapped = _LIAR_MAP.get(label)
+            if mapped is None:
+                continue  # Skip unknown labels
+            verdict, confidence = mapped
+
+            subject = item["subject"]
+            speaker = item["speaker"]
+            context = item["context"]
+        except KeyError:
+            continue
+
+        # Build evidence
+        evidence_list = []
+        if speaker:
+            evidence_list.append(f"Statement by {speaker}")
+        if subject:
+            evidence_list.append(f"Subject: {subject}")
+        if context:
+            evidence_list.append(f"Context: {context[:100]}")
+
+        yield {
+            "claim": claim_text,
+            "verdict": verdict,
+            "confidence": confidence,
+            "explanation": _LIAR_EXPLANATIONS[label],
+            "evidence": evidence_list or _LIAR_DEFAULT_EVIDENCE,
+            "sources": _LIAR_SOURCES,
+            "dataset": "LIAR"
+        }
+
 
 class DatasetLoader:
     """Load and process public fact-checking datasets"""
@@ -49,51 +177,11 @@ class DatasetLoader:
 
             self.logger.info(f"Loading FEVER dataset ({split} split, max {max_samples} samples)...")
 
-            # Load dataset from Hugging Face
-            dataset = load_dataset("fever", "v1.0", split=split, trust_remote_code=True)
-
-            claims = []
-            count = 0
-
-            for item in dataset:
-                if count >= max_samples:
-                    break
-
-                # Convert FEVER label to our verdict system
-                label = item.get("label", "NOT ENOUGH INFO")
-                if label == "SUPPORTS":
-                    verdict = Verdict.TRUE
-                    confidence = 85.0
-                elif label == "REFUTES":
-                    verdict = Verdict.FALSE
-                    confidence = 85.0
-                else:  # NOT ENOUGH INFO
-                    verdict = Verdict.UNCERTAIN
-                    confidence = 50.0
-
-                # Extract claim and evidence
-                claim_text = item.get("claim", "").strip()
-
-                if not claim_text or len(claim_text) < 10:
-                    continue
-
-                # Build evidence from Wikipedia evidence sentences
-                evidence_list = []
-                evidence_items = item.get("evidence_annotation_id", [])
-                if evidence_items:
-                    evidence_list.append(f"Evidence from {len(evidence_items)} Wikipedia source(s)")
-
-                claims.append({
-                    "claim": claim_text,
-                    "verdict": verdict,
-                    "confidence": confidence,
-                    "explanation": f"This claim was verified against Wikipedia evidence and found to be {verdict.value.lower()}.",
-                    "evidence": evidence_list if evidence_list else ["Verified via Wikipedia fact-checking"],
-                    "sources": ["FEVER Dataset", "Wikipedia"],
-                    "dataset": "FEVER"
-                })
-
-                count += 1
+            # Stream from Hugging Face so only the rows we keep are fetched,
+            # not the whole split
+            dataset = load_dataset("fever", "v1.0", split=split, streaming=True, trust_remote_code=True)
+
+            claims = list(islice(_iter_fever_claims(dataset), max_samples))
 
             self.logger.info(f"Loaded {len(claims)} claims from FEVER dataset")
             return claims
@@ -119,64 +207,11 @@ class DatasetLoader:
 
             self.logger.info(f"Loading LIAR dataset (max {max_samples} samples)...")
 
-            # Load dataset from Hugging Face
-            dataset = load_dataset("ucsbnlp/liar", split="train", trust_remote_code=True)
-
-            claims = []
-            count = 0
-
-            for item in dataset:
-                if count >= max_samples:
-                    break
-
-                # Convert LIAR label to our verdict system
-                label = item.get("label", -1)
-
-                # LIAR labels: 0=pants-fire, 1=false, 2=barely-true, 3=half-true, 4=mostly-true, 5=true
-                if label in [5, 4]:  # true, mostly-true
-                    verdict = Verdict.TRUE
-                    confidence = 80.0 if label == 5 else 70.0
-                elif label in [0, 1]:  # pants-fire, false
-                    verdict = Verdict.FALSE
-                    confidence = 90.0 if label == 0 else 85.0
-                elif label in [2, 3]:  # barely-true, half-true
-                    verdict = Verdict.MISLEADING
-                    confidence = 70.0
-                else:
-                    continue  # Skip unknown labels
-
-                # Extract claim
-                claim_text = item.get("statement", "").strip()
-
-                if not claim_text or len(claim_text) < 10:
-                    continue
-
-                # Build evidence
-                subject = item.get("subject", "")
-                speaker = item.get("speaker", "")
-                context = item.get("context", "")
-
-                evidence_list = []
-                if speaker:
-                    evidence_list.append(f"Statement by {speaker}")
-                if subject:
-                    evidence_list.append(f"Subject: {subject}")
-                if context:
-                    evidence_list.append(f"Context: {context[:100]}")
-
-                label_text = ["pants-fire", "false", "barely-true", "half-true", "mostly-true", "true"][label]
-
-                claims.append({
-                    "claim": claim_text,
-                    "verdict": verdict,
-                    "confidence": confidence,
-                    "explanation": f"This claim was fact-checked by PolitiFact and rated as '{label_text}'.",
-                    "evidence": evidence_list if evidence_list else ["Verified via PolitiFact"],
-                    "sources": ["LIAR Dataset", "PolitiFact"],
-                    "dataset": "LIAR"
-                })
-
-                count += 1
+            # Stream from Hugging Face so only the rows we keep are fetched,
+            # not the whole split
+            dataset = load_dataset("ucsbnlp/liar", split="train", streaming=True, trust_remote_code=True)
+
+            claims = list(islice(_iter_liar_claims(dataset), max_samples))
 
             self.logger.info(f"Loaded {len(claims)} claims from LIAR dataset")
             return claims
@@ -197,15 +232,15 @@ class DatasetLoader:
         """
         output_path = self.cache_dir / filename
 
-        # Convert Verdict enums to strings for JSON serialization
-        claims_json = []
-        for claim in claims:
-            claim_copy = claim.copy()
-            claim_copy["verdict"] = claim["verdict"].value
-            claims_json.append(claim_copy)
-
-        with open(output_path, "w") as f:
-            json.dump(claims_json, f, indent=2)
+        # Stream one record at a time; orjson writes the verdict enum as its
+        # value, so the claims are serialized without a converted copy
+        with open(output_path, "wb") as f:
+            f.write(b"[\n")
+            for index, claim in enumerate(claims):
+                if index:
+                    f.write(b",\n")
+                f.write(orjson.dumps(claim))
+            f.write(b"\n]")
 
         self.logger.info(f"Saved {len(claims)} claims to {output_path}")
 
@@ -224,15 +259,19 @@ class DatasetLoader:
             self.logger.warning(f"Cache file not found: {file_path}")
             return []
 
-        with open(file_path, "r") as f:
-            claims_json = json.load(f)
+        # Convert verdict strings back to Verdict enums; the parsed dicts are
+        # fresh, so convert in place
+        if file_path.stat().st_size == 0:
+            self.logger.warning(f"Cache file is empty: {file_path}")
+            return []
 
-        # Convert verdict strings back to Verdict enums
-        claims = []
-        for claim in claims_json:
-            claim_copy = claim.copy()
-            claim_copy["verdict"] = Verdict(claim["verdict"])
-            claims.append(claim_copy)
+        # Parse straight from a read-only mapping so the page cache backs the
+        # parse instead of a separate in-memory copy of the file
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                claims = orjson.loads(view)
+        for claim in claims:
+            claim["verdict"] = Verdict(claim["verdict"])
 
         self.logger.info(f"Loaded {len(claims)} claims from {file_path}")
         return claims
@@ -262,15 +301,11 @@ class DatasetLoader:
         # Load fresh datasets
         self.logger.info("Loading fresh datasets from sources...")
 
-        all_claims = []
-
-        # Load FEVER
-        fever_claims = self.load_fever_dataset(split="train", max_samples=fever_samples)
-        all_claims.extend(fever_claims)
-
-        # Load LIAR
-        liar_claims = self.load_liar_dataset(max_samples=liar_samples)
-        all_claims.extend(liar_claims)
+        # FEVER and LIAR are independent downloads; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fever_future = executor.submit(self.load_fever_dataset, split="train", max_samples=fever_samples)
+            liar_future = executor.submit(self.load_liar_dataset, max_samples=liar_samples)
+            all_claims = fever_future.result() + liar_future.result()
 
         # Save to cache
         self.save_claims_to_file(all_claims, cache_file)
@@ -281,10 +316,13 @@ class DatasetLoader:
 
 # Global instance
 _loader = None
+_loader_lock = threading.Lock()
 
 def get_dataset_loader() -> DatasetLoader:
-    """Get or create global dataset loader instance"""
+    """Get or create global dataset loader instance (thread-safe)"""
     global _loader
     if _loader is None:
-        _loader = DatasetLoader()
+        with _loader_lock:
+            if _loader is None:
+                _loader = DatasetLoader()
     return _loader
@@ -0,0 +1,119 @@
+"""
+ONNX Runtime Sentence Encoder
+
+Runs a sentence-transformer exported to ONNX (see scripts/export_onnx.py)
+through onnxruntime, with the same ``encode`` interface the semantic
+classifier uses from SentenceTransformer. On CPU this avoids PyTorch
+overhead and, with the int8-quantized export, uses VNNI matmul kernels.
+"""
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from utils.config import settings
+
+# File written by ORTQuantizer; the unquantized export is model.onnx
+QUANTIZED_FILE = "model_quantized.onnx"
+UNQUANTIZED_FILE = "model.onnx"
+
+
+def onnx_model_dir(model_name: str) -> Path:
+    """Get the directory holding the ONNX export of a model
+
+    Args:
+        model_name: Sentence transformer model name (e.g. all-MiniLM-L6-v2)
+
+    Returns:
+        Path under the models directory
+    """
+    return settings.models_dir / f"{model_name.replace('/', '_')}-onnx"
+
+
+class OnnxSentenceEncoder:
+    """Mean-pooled sentence embeddings from an ONNX feature-extraction model"""
+
+    def __init__(self, model_dir: Path, max_length: int = 256):
+        """
+        Load the exported model and its tokenizer
+
+        Args:
+            model_dir: Directory produced by scripts/export_onnx.py
+            max_length: Maximum tokens per sentence (MiniLM was trained on 256)
+
+        Raises:
+            ImportError: If optimum[onnxruntime] is not installed
+            FileNotFoundError: If the directory has no ONNX model
+        """
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        if (model_dir / QUANTIZED_FILE).exists():
+            file_name = QUANTIZED_FILE
+        elif (model_dir / UNQUANTIZED_FILE).exists():
+            file_name = UNQUANTIZED_FILE
+        else:
+            raise FileNotFoundError(f"No ONNX model in {model_dir}")
+
+        self.file_name = file_name
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir,
+            file_name=file_name,
+            provider="CPUExecutionProvider"
+        )
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Encode sentences into embeddings
+
+        Mirrors SentenceTransformer.encode: inputs are sorted by length so
+        each batch pads as little as possible, then restored to input order.
+
+        Args:
+            sentences: Sentences to encode
+            batch_size: Sentences per forward pass
+            convert_to_numpy: Accepted for compatibility; always returns numpy
+            normalize_embeddings: L2-normalize each embedding
+            show_progress_bar: Accepted for compatibility; ignored
+
+        Returns:
+            float32 array of shape (len(sentences), dim)
+        """
+        order = np.argsort([-len(sentence) for sentence in sentences], kind="stable")
+        chunks = []
+
+        for start in range(0, len(sentences), batch_size):
+            batch = [sentences[i] for i in order[start:start + batch_size]]
+            inputs = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+
+            # Mean pooling over real (non-padding) tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            chunks.append(pooled.astype(np.float32))
+
+        embeddings = np.empty((len(sentences), chunks[0].shape[1] if chunks else 0), dtype=np.float32)
+        if chunks:
+            embeddings[order] = np.concatenate(chunks)
+
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, np.finfo(np.float32).tiny)
+
+        return embeddings
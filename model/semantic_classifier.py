@@ -6,18 +6,112 @@ Uses sentence transformers for semantic similarity matching and
 claim classification without requiring external APIs.
 """
 
+import hashlib
+import heapq
 import os
+import threading
+from collections import OrderedDict
 import numpy as np
+from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass
 import json
 
+from utils.config import settings
 from utils.logger import get_logger
 from core.models import Verdict
 from core.claims_database import ClaimsDatabase
+from model.onnx_encoder import onnx_model_dir
 
 logger = get_logger(__name__)
 
+# Optional SIMD kernels (AVX2/AVX-512/NEON) for the similarity search
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+# Optional approximate nearest-neighbour index for large claim databases
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Optional TF-IDF scoring for the fallback matcher (no torch needed)
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import linear_kernel
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Use the ANN index from this many claims up; search breadth (recall vs speed)
+_ANN_MIN_CLAIMS = 10000
+_ANN_EF_SEARCH = 50
+
+# Classifications remembered per normalized claim text
+_CLASSIFY_CACHE_SIZE = 4096
+
+# Minimum similarity for classify_claims, per scorer. TF-IDF cosine runs
+# higher than embedding cosine or word-overlap Jaccard for unrelated text
+# sharing a topic word, so it needs its own cut-off (tuned against
+# paraphrases and near-misses of the built-in claims)
+_CLASSIFY_THRESHOLD = 0.65
+_CLASSIFY_TFIDF_THRESHOLD = 0.80
+
+# CCB_FP32=1 keeps the embedding matrix in float32 (no int8/float16)
+_FORCE_FP32 = os.environ.get("CCB_FP32") == "1"
+
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on (respects affinity/cgroups)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _configure_torch_threads():
+    """Size PyTorch's thread pools to the CPUs available to this process
+
+    The OpenMP/MKL variables only take effect if set before torch is first
+    imported; explicit values in the environment are left alone (the API
+    server sets them to its share of the CPUs per worker). Autograd is
+    left alone: SentenceTransformer.encode already disables it around the
+    forward pass, in whichever thread it runs.
+    """
+    threads = str(_available_cpus())
+    os.environ.setdefault("OMP_NUM_THREADS", threads)
+    os.environ.setdefault("MKL_NUM_THREADS", threads)
+
+    import torch
+
+    torch.set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+    try:
+        # One op at a time; parallelism comes from intra-op threads
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already set, or inter-op work has started
+
+
+def _quantize_int8(vectors: np.ndarray) -> np.ndarray:
+    """Quantize vectors to int8 with a per-vector scale.
+
+    Each vector is scaled so its largest component maps to 127. Cosine
+    similarity ignores scale, so the scales need not be kept.
+
+    Args:
+        vectors: Float array, one vector per row (or a single vector)
+
+    Returns:
+        int8 array of the same shape
+    """
+    peak = np.abs(vectors).max(axis=-1, keepdims=True)
+    scale = 127.0 / np.maximum(peak, np.finfo(np.float32).tiny)
+    return np.rint(vectors * scale).astype(np.int8)
+
 
 @dataclass
 class SimilarityMatch:
@@ -39,30 +133,88 @@ class SemanticClassifier:
     and classify new claims based on semantic similarity.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", use_transformers: bool = True):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        use_transformers: bool = True,
+        use_int8: bool = True
+    ):
         """
         Initialize semantic classifier
 
         Args:
             model_name: Name of the sentence transformer model
             use_transformers: Whether to use transformers (requires installation)
+            use_int8: Store embeddings as int8 (needs SimSIMD; float16, or
+                float32 without SimSIMD, otherwise)
         """
         self.logger = logger
         self.model_name = model_name
         self.use_transformers = use_transformers
+        # int8 only pays off with SimSIMD's integer kernels; NumPy has no
+        # BLAS path for int8 matrix products
+        self.use_int8 = use_int8 and SIMSIMD_AVAILABLE and not _FORCE_FP32
+        # Otherwise SimSIMD's f16 kernels still halve the bytes read per
+        # search; NumPy has no BLAS path for float16 either, so it keeps float32
+        self.use_fp16 = not self.use_int8 and SIMSIMD_AVAILABLE and not _FORCE_FP32
         self.model = None
-        self.embeddings_cache: Dict[str, np.ndarray] = {}
+        # Database claims and their L2-normalized embeddings, row i <-> claim i
+        self._claim_list: List[str] = []
+        self._emb_matrix: Optional[np.ndarray] = None
+        self._ann_index = None
+
+        # LRU of classify results keyed by normalized claim; hybrid runs
+        # classify from worker threads, so access is locked
+        self._classify_cache: "OrderedDict[str, Optional[SimilarityMatch]]" = OrderedDict()
+        self._classify_lock = threading.Lock()
+
+        # Word sets for the fallback matcher, built once instead of per query
+        self._fallback_entries: List[Tuple[str, frozenset, int, Dict]] = []
+        for db_claim, claim_data in ClaimsDatabase.ALL_CLAIMS.items():
+            db_words = frozenset(db_claim.split())
+            if db_words:
+                self._fallback_entries.append((db_claim, db_words, len(db_words), claim_data))
 
         # Try to load the model
         self._load_model()
 
+        # Without a model, score the fallback with TF-IDF when available
+        self._tfidf = None
+        self._tfidf_matrix = None
+        if self.model is None and SKLEARN_AVAILABLE and self._fallback_entries:
+            self._tfidf = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)
+            self._tfidf_matrix = self._tfidf.fit_transform(entry[0] for entry in self._fallback_entries)
+
     def _load_model(self):
         """Load the sentence transformer model"""
         if not self.use_transformers:
             self.logger.info("Transformers disabled, using fallback matching")
             return
 
+        # Prefer an ONNX export (scripts/export_onnx.py) when one exists
+        onnx_dir = onnx_model_dir(self.model_name)
+        if onnx_dir.is_dir():
+            try:
+                from model.onnx_encoder import OnnxSentenceEncoder
+
+                self.logger.info(f"Loading ONNX model from {onnx_dir}")
+                self.model = OnnxSentenceEncoder(onnx_dir)
+                self.logger.info(f"ONNX model loaded ({self.model.file_name})")
+
+                self._precompute_embeddings()
+                return
+
+            except ImportError:
+                self.logger.warning(
+                    "ONNX model found but optimum is not installed. "
+                    "Install with: pip install optimum[onnxruntime]"
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to load ONNX model: {e}")
+            self.model = None
+
         try:
+            _configure_torch_threads()
             from sentence_transformers import SentenceTransformer
 
             self.logger.info(f"Loading sentence transformer model: {self.model_name}")
@@ -89,25 +241,142 @@ class SemanticClassifier:
 
         self.logger.info("Pre-computing embeddings for database claims...")
 
-        all_claims = []
-
         # Get all claims from database
-        for claim_dict in [
-            ClaimsDatabase.FALSE_CLAIMS,
-            ClaimsDatabase.TRUE_CLAIMS,
-            ClaimsDatabase.MISLEADING_CLAIMS
-        ]:
-            all_claims.extend(claim_dict.keys())
+        all_claims = list(ClaimsDatabase.ALL_CLAIMS)
+
+        # Reuse the matrix from an earlier run for the same model and claims
+        cache_path = self._embeddings_cache_path(all_claims)
+        matrix = self._load_cached_embeddings(cache_path, len(all_claims))
+
+        if matrix is None:
+            # Compute embeddings in batch (more efficient)
+            embeddings = self.model.encode(all_claims, show_progress_bar=False)
+
+            # Stack into one contiguous matrix with unit-length rows, so cosine
+            # similarity against every claim is a single matrix-vector product
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.maximum(norms, np.finfo(np.float32).tiny)
+
+            self._save_cached_embeddings(cache_path, matrix)
+
+        self._claim_list = all_claims
 
-        # Compute embeddings in batch (more efficient)
-        embeddings = self.model.encode(all_claims, show_progress_bar=False)
+        # Large databases (e.g. the downloaded datasets) get an ANN index;
+        # below that an exact scan is already fast
+        if HNSWLIB_AVAILABLE and len(all_claims) >= _ANN_MIN_CLAIMS:
+            self._ann_index = self._load_or_build_ann_index(cache_path.with_suffix(".hnsw"), matrix)
 
-        # Store in cache
-        for claim, embedding in zip(all_claims, embeddings):
-            self.embeddings_cache[claim] = embedding
+        if self.use_int8:
+            # 4x smaller than float32, and less memory traffic per search
+            matrix = _quantize_int8(matrix)
+        elif self.use_fp16:
+            matrix = matrix.astype(np.float16)
+        # Contiguous so SimSIMD can read the rows without copying
+        self._emb_matrix = np.ascontiguousarray(matrix)
 
         self.logger.info(f"Pre-computed {len(all_claims)} embeddings")
 
+    def _embeddings_cache_path(self, claims: List[str]) -> Path:
+        """
+        Get the on-disk location of the embedding matrix for these claims
+
+        The file name hashes the model (and ONNX variant, if any) together
+        with the claims in order, so any change produces a new file.
+
+        Args:
+            claims: Database claims, in matrix row order
+
+        Returns:
+            Path of the .npy file
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.model_name}|{getattr(self.model, 'file_name', 'torch')}".encode())
+        for claim in claims:
+            digest.update(b"\0" + claim.encode())
+        return settings.cache_dir / "embeddings" / f"{digest.hexdigest()}.npy"
+
+    def _load_cached_embeddings(self, path: Path, rows: int) -> Optional[np.ndarray]:
+        """
+        Memory-map a previously saved embedding matrix
+
+        Args:
+            path: File from _embeddings_cache_path
+            rows: Expected number of rows
+
+        Returns:
+            Read-only normalized matrix, or None if missing/unusable
+        """
+        if not path.exists():
+            return None
+
+        try:
+            matrix = np.load(path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable embeddings cache {path}: {e}")
+            return None
+
+        if matrix.ndim != 2 or matrix.shape[0] != rows or matrix.dtype != np.float32:
+            return None
+
+        self.logger.info(f"Loaded cached embeddings from {path}")
+        return matrix
+
+    def _save_cached_embeddings(self, path: Path, matrix: np.ndarray):
+        """
+        Persist the normalized embedding matrix for later runs
+
+        Args:
+            path: File from _embeddings_cache_path
+            matrix: Normalized float32 embedding matrix
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not save embeddings cache: {e}")
+
+    def _load_or_build_ann_index(self, path: Path, matrix: np.ndarray):
+        """
+        Load the HNSW index for the embedding matrix, building it if needed
+
+        Args:
+            path: Index file next to the embeddings cache
+            matrix: Normalized float32 embedding matrix
+
+        Returns:
+            hnswlib index over the matrix rows (labels are row numbers)
+        """
+        rows, dim = matrix.shape
+        index = hnswlib.Index(space="cosine", dim=dim)
+
+        if path.exists():
+            try:
+                index.load_index(str(path), max_elements=rows)
+                index.set_ef(_ANN_EF_SEARCH)
+                self.logger.info(f"Loaded ANN index from {path}")
+                return index
+            except RuntimeError as e:
+                self.logger.warning(f"Rebuilding unreadable ANN index {path}: {e}")
+                index = hnswlib.Index(space="cosine", dim=dim)
+
+        self.logger.info(f"Building ANN index for {rows} claims...")
+        index.init_index(max_elements=rows, ef_construction=200, M=16)
+        index.add_items(matrix, np.arange(rows))
+        index.set_ef(_ANN_EF_SEARCH)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            index.save_index(str(path))
+        except (OSError, RuntimeError) as e:
+            self.logger.warning(f"Could not save ANN index: {e}")
+
+        return index
+
     def find_similar_claims(
         self,
         query: str,
@@ -125,100 +394,151 @@ class SemanticClassifier:
         Returns:
             List of similar claims with similarity scores
         """
+        return self.find_similar_claims_batch([query], threshold, top_k)[0]
+
+    def find_similar_claims_batch(
+        self,
+        queries: List[str],
+        threshold: float = 0.7,
+        top_k: int = 3
+    ) -> List[List[SimilarityMatch]]:
+        """
+        Find semantically similar claims for several queries at once
+
+        All queries go through the model in one encode call, so a post with
+        several claims pays for a single batched forward pass.
+
+        Args:
+            queries: Query claims to match
+            threshold: Minimum similarity score (0-1)
+            top_k: Number of top matches to return per query
+
+        Returns:
+            One list of similar claims per query, in query order
+        """
         if not self.model:
             # Fallback to string matching
-            return self._fallback_matching(query, threshold)
+            return [self._fallback_matching(query, threshold) for query in queries]
 
         try:
-            # Encode the query
-            query_embedding = self.model.encode([query])[0]
-
-            # Compute similarities with all cached embeddings
-            similarities = []
+            k = min(top_k, len(self._claim_list))
+            if k <= 0 or not queries:
+                return [[] for _ in queries]
+
+            # Encode all queries in one call; the model normalizes them and
+            # sorts by length internally to minimize padding
+            query_embeddings = np.asarray(
+                self.model.encode(
+                    queries,
+                    batch_size=32,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                ),
+                dtype=np.float32
+            )
 
-            for db_claim, db_embedding in self.embeddings_cache.items():
-                # Cosine similarity
-                similarity = np.dot(query_embedding, db_embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(db_embedding)
+            if self._ann_index is not None:
+                # Approximate nearest neighbours; labels/distances come back
+                # already ordered best first
+                labels, distances = self._ann_index.knn_query(query_embeddings, k=k)
+                ranked = zip(labels, 1.0 - distances)
+            else:
+                # Cosine similarity of every query with every database claim
+                if SIMSIMD_AVAILABLE:
+                    if self.use_int8:
+                        query_embeddings = _quantize_int8(query_embeddings)
+                    elif self.use_fp16:
+                        query_embeddings = query_embeddings.astype(np.float16)
+                    distances = simsimd.cdist(query_embeddings, self._emb_matrix, metric="cosine")
+                    similarities = 1.0 - np.asarray(distances, dtype=np.float32)
+                else:
+                    similarities = query_embeddings @ self._emb_matrix.T
+
+                # Top k per query without sorting whole rows, then order just those
+                top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+                ordered = np.take_along_axis(
+                    top, np.argsort(-np.take_along_axis(similarities, top, axis=1), axis=1), axis=1
                 )
+                ranked = zip(ordered, np.take_along_axis(similarities, ordered, axis=1))
+
+            results = []
+            for indices, scores in ranked:
+                matches = []
+                for index, score in zip(indices, scores):
+                    similarity = float(score)
+                    if similarity < threshold:
+                        break
 
-                if similarity >= threshold:
                     # Find the claim data
+                    db_claim = self._claim_list[index]
                     claim_data = self._get_claim_data(db_claim)
                     if claim_data:
-                        similarities.append(SimilarityMatch(
+                        matches.append(SimilarityMatch(
                             claim=db_claim,
-                            similarity=float(similarity),
+                            similarity=similarity,
                             verdict=claim_data["verdict"],
                             confidence=claim_data["confidence"],
                             explanation=claim_data["explanation"],
                             evidence=claim_data["evidence"],
                             sources=claim_data["sources"]
                         ))
+                results.append(matches)
 
-            # Sort by similarity and return top k
-            similarities.sort(key=lambda x: x.similarity, reverse=True)
-            return similarities[:top_k]
+            return results
 
         except Exception as e:
             self.logger.error(f"Error in semantic matching: {e}")
-            return self._fallback_matching(query, threshold)
+            return [self._fallback_matching(query, threshold) for query in queries]
 
     def _get_claim_data(self, claim: str) -> Optional[Dict]:
         """Get claim data from database"""
-        for db_dict in [
-            ClaimsDatabase.FALSE_CLAIMS,
-            ClaimsDatabase.TRUE_CLAIMS,
-            ClaimsDatabase.MISLEADING_CLAIMS
-        ]:
-            if claim in db_dict:
-                return db_dict[claim]
-        return None
+        return ClaimsDatabase.ALL_CLAIMS.get(claim)
 
     def _fallback_matching(self, query: str, threshold: float) -> List[SimilarityMatch]:
         """
-        Fallback matching using simple string similarity
+        Fallback matching using TF-IDF cosine (or word overlap without sklearn)
         Used when transformers are not available
         """
         matches = []
         query_lower = query.lower()
-        query_words = set(query_lower.split())
-
-        # Search all dictionaries
-        for db_dict in [
-            ClaimsDatabase.FALSE_CLAIMS,
-            ClaimsDatabase.TRUE_CLAIMS,
-            ClaimsDatabase.MISLEADING_CLAIMS
-        ]:
-            for db_claim, claim_data in db_dict.items():
-                db_words = set(db_claim.split())
-
-                # Calculate word overlap similarity
-                if not db_words:
-                    continue
-
+        query_words = frozenset(query_lower.split())
+        query_len = len(query_words)
+
+        # Database claims occurring in the query, from one automaton scan
+        contained = ClaimsDatabase.find_contained(query_lower)
+
+        # TF-IDF cosine against every claim in one sparse product
+        tfidf_scores = None
+        if self._tfidf is not None:
+            tfidf_scores = linear_kernel(self._tfidf.transform([query_lower]), self._tfidf_matrix).ravel()
+
+        # Search all claims (word sets precomputed, empty ones excluded)
+        for index, (db_claim, db_words, db_len, claim_data) in enumerate(self._fallback_entries):
+            if tfidf_scores is not None:
+                similarity = float(tfidf_scores[index])
+            else:
+                # Calculate word overlap (Jaccard) similarity; the union size
+                # follows from the intersection, so no union set is built
                 intersection = len(query_words & db_words)
-                union = len(query_words | db_words)
-                similarity = intersection / union if union > 0 else 0.0
-
-                # Also check if db_claim is substring of query or vice versa
-                if db_claim in query_lower or query_lower in db_claim:
-                    similarity = max(similarity, 0.85)
-
-                if similarity >= threshold:
-                    matches.append(SimilarityMatch(
-                        claim=db_claim,
-                        similarity=similarity,
-                        verdict=claim_data["verdict"],
-                        confidence=claim_data["confidence"],
-                        explanation=claim_data["explanation"],
-                        evidence=claim_data["evidence"],
-                        sources=claim_data["sources"]
-                    ))
-
-        # Sort by similarity
-        matches.sort(key=lambda x: x.similarity, reverse=True)
-        return matches[:3]
+                similarity = intersection / (query_len + db_len - intersection)
+
+            # Also check if db_claim is substring of query or vice versa
+            if db_claim in contained or query_lower in db_claim:
+                similarity = max(similarity, 0.85)
+
+            if similarity >= threshold:
+                matches.append(SimilarityMatch(
+                    claim=db_claim,
+                    similarity=similarity,
+                    verdict=claim_data["verdict"],
+                    confidence=claim_data["confidence"],
+                    explanation=claim_data["explanation"],
+                    evidence=claim_data["evidence"],
+                    sources=claim_data["sources"]
+                ))
+
+        # Top 3 by similarity without sorting every match
+        return heapq.nlargest(3, matches, key=lambda x: x.similarity)
 
     def classify_claim(self, claim: str) -> Optional[SimilarityMatch]:
         """
@@ -230,9 +550,64 @@ class SemanticClassifier:
         Returns:
             Best matching claim with verdict, or None if no good match
         """
-        similar_claims = self.find_similar_claims(claim, threshold=0.65, top_k=1)
+        return self.classify_claims([claim])[0]
+
+    def classify_claims(self, claims: List[str]) -> List[Optional[SimilarityMatch]]:
+        """
+        Classify several claims with one batched similarity search
+
+        Args:
+            claims: Claims to classify
+
+        Returns:
+            Best matching claim with verdict (or None) per claim, in order
+        """
+        # Repeated text (reposts, copied headlines) skips encoding and search
+        keys = [" ".join(claim.lower().split()) for claim in claims]
+        results: List[Optional[SimilarityMatch]] = [None] * len(claims)
+        missing: Dict[str, List[int]] = {}
+
+        with self._classify_lock:
+            for position, key in enumerate(keys):
+                if key in self._classify_cache:
+                    self._classify_cache.move_to_end(key)
+                    results[position] = self._classify_cache[key]
+                else:
+                    missing.setdefault(key, []).append(position)
+
+        if missing:
+            claims_to_classify = [claims[positions[0]] for positions in missing.values()]
+            matches = self._classify_uncached(claims_to_classify)
+
+            with self._classify_lock:
+                for (key, positions), match in zip(missing.items(), matches):
+                    for position in positions:
+                        results[position] = match
+                    self._classify_cache[key] = match
+                    self._classify_cache.move_to_end(key)
+                while len(self._classify_cache) > _CLASSIFY_CACHE_SIZE:
+                    self._classify_cache.popitem(last=False)
+
+        return results
+
+    def _classify_uncached(self, claims: List[str]) -> List[Optional[SimilarityMatch]]:
+        """
+        Classify claims with one batched similarity search, bypassing the cache
+
+        Args:
+            claims: Claims to classify
+
+        Returns:
+            Best matching claim with verdict (or None) per claim, in order
+        """
+        results = []
+        threshold = _CLASSIFY_TFIDF_THRESHOLD if self._tfidf is not None else _CLASSIFY_THRESHOLD
+
+        for similar_claims in self.find_similar_claims_batch(claims, threshold=threshold, top_k=1):
+            if not similar_claims:
+                results.append(None)
+                continue
 
-        if similar_claims:
             best_match = similar_claims[0]
 
             # Adjust confidence based on similarity
@@ -244,7 +619,7 @@ class SemanticClassifier:
             )
 
             # Return match with adjusted confidence
-            return SimilarityMatch(
+            results.append(SimilarityMatch(
                 claim=best_match.claim,
                 similarity=best_match.similarity,
                 verdict=best_match.verdict,
@@ -252,9 +627,9 @@ class SemanticClassifier:
                 explanation=best_match.explanation,
                 evidence=best_match.evidence,
                 sources=best_match.sources
-            )
+            ))
 
-        return None
+        return results
 
     def is_model_available(self) -> bool:
         """Check if the transformer model is available"""
@@ -266,8 +641,11 @@ class SemanticClassifier:
             "model_name": self.model_name,
             "transformers_available": self.use_transformers,
             "model_loaded": self.model is not None,
-            "cached_embeddings": len(self.embeddings_cache),
-            "fallback_mode": not self.is_model_available()
+            "cached_embeddings": len(self._claim_list),
+            "similarity_backend": "hnsw" if self._ann_index is not None else ("simsimd" if SIMSIMD_AVAILABLE else "numpy"),
+            "embedding_dtype": "int8" if self.use_int8 else ("float16" if self.use_fp16 else "float32"),
+            "fallback_mode": not self.is_model_available(),
+            "fallback_scoring": "tfidf" if self._tfidf is not None else "word_overlap"
         }
 
 
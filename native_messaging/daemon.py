@@ -0,0 +1,268 @@
+"""Warm verification daemon for the native messaging host.
+
+The browser starts a fresh host process for every extension connection,
+and building a VerificationEngine (sentence-transformer, embeddings) takes
+seconds. Instead, one long-lived daemon holds a warm engine and serves
+native-messaging frames over a Unix domain socket; each host process is
+only a broker that pumps bytes between stdin/stdout and the socket,
+starting the daemon on first use.
+
+The socket carries exactly the browser's framing (4-byte length prefix +
+UTF-8 JSON), so the broker forwards bytes without parsing them.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Optional, Set
+
+import orjson
+
+from native_messaging.protocol import NativeMessagingProtocol, encode_message, _LENGTH, MAX_MESSAGE_BYTES
+from utils.config import settings
+from utils.logger import setup_logger
+
+# File only: in a broker, stdout is the browser's framing channel
+logger = setup_logger(name="native_daemon", log_file="logs/native_daemon.log", console=False)
+
+# The daemon needs Unix domain sockets and flock
+DAEMON_SUPPORTED = os.name == "posix" and hasattr(socket, "AF_UNIX")
+
+# The socket lives in a private (0700) directory, so it is never reachable
+# by other users, not even between bind and chmod
+SOCKET_DIR = settings.cache_dir / "native_host"
+SOCKET_PATH = SOCKET_DIR / "daemon.sock"
+LOCK_PATH = settings.cache_dir / "native_host.lock"
+
+# How long a broker waits for a starting daemon (model load included)
+_STARTUP_TIMEOUT_SECONDS = 120.0
+# Exit after this long without any connected host
+_IDLE_SHUTDOWN_SECONDS = 30 * 60
+_PUMP_CHUNK_BYTES = 64 * 1024
+
+
+class StreamProtocol(NativeMessagingProtocol):
+    """Protocol whose responses go to a daemon client connection."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        """Initialize the protocol.
+
+        Args:
+            writer: Stream of the connected host process
+        """
+        self.writer = writer
+
+    def send_message(self, message):
+        """Send a message to the connected host.
+
+        Args:
+            message: Dictionary to send as JSON
+        """
+        try:
+            self.writer.write(encode_message(message))
+        except Exception as e:
+            logger.error(f"Error sending message: {e}")
+
+
+async def _serve():
+    """Serve warm verification over the daemon socket until idle."""
+    # Imported here, not at module level: brokers import this module too and
+    # must not load the engine, cache or HTTP client
+    from core.verification_engine import VerificationEngine
+    from cloud.base_client import close_http_client
+    from native_messaging.host import NativeMessagingHost
+
+    engine = VerificationEngine()
+    active_connections = 0
+    last_activity = time.monotonic()
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        nonlocal active_connections, last_activity
+        active_connections += 1
+        host = NativeMessagingHost(protocol=StreamProtocol(writer), engine=engine)
+        tasks: Set[asyncio.Task] = set()
+
+        try:
+            while True:
+                header = await reader.readexactly(_LENGTH.size)
+                length = _LENGTH.unpack(header)[0]
+                if length > MAX_MESSAGE_BYTES:
+                    # Framing is lost past a bogus length; drop the connection
+                    logger.error(f"Message too large: {length} bytes (max {MAX_MESSAGE_BYTES})")
+                    host.protocol.send_error("Message too large", "MESSAGE_TOO_LARGE")
+                    break
+                body = await reader.readexactly(length)
+
+                try:
+                    message = orjson.loads(body)
+                except orjson.JSONDecodeError as e:
+                    host.protocol.send_error(f"Invalid JSON message: {e}", "INVALID_JSON")
+                    continue
+
+                # Handle concurrently, like the in-process host
+                task = asyncio.create_task(host.handle_message(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Host closed its end (browser disconnected)
+        finally:
+            # Finish in-flight requests so their responses are delivered
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            active_connections -= 1
+            last_activity = time.monotonic()
+
+    # mkdir's mode is masked by the umask and ignored for an existing
+    # directory, so set it explicitly before binding
+    SOCKET_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(SOCKET_DIR, 0o700)
+
+    # A leftover socket file from a crashed daemon would block the bind
+    SOCKET_PATH.unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(handle_connection, path=str(SOCKET_PATH))
+    logger.info(f"Native host daemon listening on {SOCKET_PATH}")
+
+    try:
+        while True:
+            await asyncio.sleep(60)
+            if not active_connections and time.monotonic() - last_activity > _IDLE_SHUTDOWN_SECONDS:
+                logger.info("Idle, shutting down")
+                break
+    finally:
+        server.close()
+        await server.wait_closed()
+        SOCKET_PATH.unlink(missing_ok=True)
+        await close_http_client()
+
+
+def run_daemon():
+    """Run the daemon unless another one already holds the lock."""
+    import fcntl
+
+    settings.cache_dir.mkdir(parents=True, exist_ok=True)
+    lock_file = open(LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        logger.info("Another native host daemon is running")
+        return
+
+    try:
+        asyncio.run(_serve())
+    except Exception as e:
+        logger.error(f"Native host daemon failed: {e}", exc_info=True)
+        sys.exit(1)
+    finally:
+        lock_file.close()
+
+
+def _connect() -> Optional[socket.socket]:
+    """Connect to the daemon socket.
+
+    Returns:
+        Connected socket, or None if no daemon is listening
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(SOCKET_PATH))
+        return sock
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+
+def _spawn_daemon() -> subprocess.Popen:
+    """Start the daemon in its own session, detached from this host.
+
+    Returns:
+        Handle of the started process
+    """
+    logger.info("Starting native host daemon")
+    return subprocess.Popen(
+        [sys.executable, str(settings.project_root / "native_messaging" / "host.py"), "--daemon"],
+        cwd=str(settings.project_root),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def _pump(sock: socket.socket):
+    """Forward stdin to the daemon and the daemon's replies to stdout.
+
+    Args:
+        sock: Connected daemon socket
+    """
+    def stdin_to_socket():
+        stdin = sys.stdin.buffer.raw
+        buffer = memoryview(bytearray(_PUMP_CHUNK_BYTES))
+        try:
+            while True:
+                count = stdin.readinto(buffer)
+                if not count:
+                    break
+                sock.sendall(buffer[:count])
+        except OSError:
+            pass
+        finally:
+            # Tell the daemon no more requests are coming
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    threading.Thread(target=stdin_to_socket, daemon=True).start()
+
+    stdout = sys.stdout.buffer
+    try:
+        while True:
+            chunk = sock.recv(_PUMP_CHUNK_BYTES)
+            if not chunk:
+                break
+            stdout.write(chunk)
+            stdout.flush()
+    except OSError as e:
+        logger.error(f"Lost connection to native host daemon: {e}")
+    finally:
+        sock.close()
+
+
+def run_broker() -> bool:
+    """Serve this host's messages through the warm daemon.
+
+    Returns:
+        True once the session has been served; False if the daemon could not
+        be reached (nothing has been read from stdin yet)
+    """
+    sock = _connect()
+
+    if sock is None:
+        process = _spawn_daemon()
+        deadline = time.monotonic() + _STARTUP_TIMEOUT_SECONDS
+
+        while sock is None and time.monotonic() < deadline:
+            # Exit code 0 means another daemon is already starting up
+            if process.poll() not in (None, 0):
+                logger.error("Native host daemon failed to start")
+                return False
+            time.sleep(0.1)
+            sock = _connect()
+
+        if sock is None:
+            logger.error("Timed out waiting for native host daemon")
+            return False
+
+    _pump(sock)
+    return True
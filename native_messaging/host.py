@@ -9,38 +9,66 @@ import asyncio
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional, Set
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from native_messaging.protocol import NativeMessagingProtocol
-from core.verification_engine import VerificationEngine
-from core.hybrid_decisor import VerificationStrategy
 from utils.logger import get_logger, setup_logger
 from utils.config import settings
 
+# The engine, cache and HTTP client are imported where first used, so a
+# broker process (see main) never loads them
+if TYPE_CHECKING:
+    from core.verification_engine import VerificationEngine
+
 # Ensure logs directory exists
 settings.ensure_directories()
 
 # Setup logger for native host (log to file, not stdout)
-logger = setup_logger(name="native_host", log_file="logs/native_host.log")
+logger = setup_logger(name="native_host", log_file="logs/native_host.log", console=False)
 
 
 class NativeMessagingHost:
     """Native messaging host that handles extension requests."""
 
-    def __init__(self):
-        """Initialize the native messaging host."""
-        self.protocol = NativeMessagingProtocol()
-        self.engine = VerificationEngine()
+    def __init__(
+        self,
+        protocol: Optional[NativeMessagingProtocol] = None,
+        engine: Optional["VerificationEngine"] = None
+    ):
+        """Initialize the native messaging host.
+
+        Args:
+            protocol: Where responses are written (stdin/stdout if not provided)
+            engine: Verification engine to share (a new one if not provided)
+        """
+        if engine is None:
+            from core.verification_engine import VerificationEngine
+            engine = VerificationEngine()
+
+        self.protocol = protocol or NativeMessagingProtocol()
+        self.engine = engine
         self.logger = logger
+        # Messages are handled concurrently, at most this many at a time
+        self._message_slots = asyncio.Semaphore(4)
+        self._tasks: Set[asyncio.Task] = set()
         self.logger.info("Native messaging host started")
 
     async def handle_message(self, message: Dict[str, Any]):
         """Handle a message from the extension.
 
+        Args:
+            message: Message from extension
+        """
+        async with self._message_slots:
+            await self._dispatch_message(message)
+
+    async def _dispatch_message(self, message: Dict[str, Any]):
+        """Route a message to its handler.
+
         Args:
             message: Message from extension
         """
@@ -73,6 +101,8 @@ class NativeMessagingHost:
             request_id: Request ID
             data: Request data containing text, url, platform, etc.
         """
+        from core.hybrid_decisor import VerificationStrategy, STRATEGY_BY_NAME
+
         try:
             text = data.get("text")
             if not text:
@@ -85,12 +115,7 @@ class NativeMessagingHost:
             strategy_str = data.get("strategy", "hybrid")
 
             # Map strategy string to enum
-            strategy_map = {
-                "local": VerificationStrategy.LOCAL_ONLY,
-                "cloud": VerificationStrategy.CLOUD_ONLY,
-                "hybrid": VerificationStrategy.HYBRID
-            }
-            strategy = strategy_map.get(strategy_str, VerificationStrategy.HYBRID)
+            strategy = STRATEGY_BY_NAME.get(strategy_str, VerificationStrategy.HYBRID)
 
             # Run verification
             result = await self.engine.verify(
@@ -142,27 +167,51 @@ class NativeMessagingHost:
 
         try:
             while True:
-                # Read message from stdin
-                message = self.protocol.read_message()
+                # Read message from stdin in a worker thread so in-flight
+                # verifications keep running while we wait for the next one
+                message = await asyncio.to_thread(self.protocol.read_message)
 
                 if message is None:
                     # stdin closed, exit
                     self.logger.info("stdin closed, exiting")
                     break
 
-                # Handle message
-                await self.handle_message(message)
+                # Handle message concurrently; responses carry request_id
+                task = asyncio.create_task(self.handle_message(message))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
 
         except KeyboardInterrupt:
             self.logger.info("Interrupted by user")
         except Exception as e:
             self.logger.error(f"Fatal error in message loop: {e}", exc_info=True)
         finally:
+            from cloud.base_client import close_http_client
+
+            # Let in-flight requests finish and send their responses
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            await close_http_client()
             self.logger.info("Native messaging host stopped")
 
 
 def main():
-    """Main entry point for native messaging host."""
+    """Main entry point for native messaging host.
+
+    By default the host forwards messages to a long-lived daemon that keeps
+    the engine and model warm (see native_messaging/daemon.py), starting it
+    if needed. Without Unix sockets, or if the daemon can't be reached, the
+    host verifies in-process as before.
+    """
+    from native_messaging.daemon import DAEMON_SUPPORTED, run_broker, run_daemon
+
+    if "--daemon" in sys.argv:
+        run_daemon()
+        return
+
+    if DAEMON_SUPPORTED and settings.native_host_daemon and run_broker():
+        return
+
     try:
         host = NativeMessagingHost()
         asyncio.run(host.run())
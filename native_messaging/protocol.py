@@ -6,15 +6,68 @@ Implements the Chrome/Firefox native messaging protocol:
 - Reads from stdin, writes to stdout
 """
 
-import json
 import struct
 import sys
 from typing import Dict, Any, Optional
 
+import orjson
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Message length prefix: 4-byte unsigned int in native byte order
+_LENGTH = struct.Struct('=I')
+
+# Largest incoming message accepted. Verification requests are a post's
+# text, far below this; a corrupt or hostile length prefix must not make
+# the reader allocate up to 4 GiB
+MAX_MESSAGE_BYTES = 8 * 1024 * 1024
+
+# Reused receive buffer, grown when a larger message arrives
+_read_buffer = bytearray(64 * 1024)
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a message as a length-prefixed native messaging frame.
+
+    Args:
+        message: Dictionary to send as JSON
+
+    Returns:
+        4-byte length prefix followed by the UTF-8 JSON body
+    """
+    message_bytes = orjson.dumps(message)
+    return _LENGTH.pack(len(message_bytes)) + message_bytes
+
+
+def _read_exact(length: int) -> memoryview:
+    """Read up to ``length`` bytes from stdin into the shared buffer.
+
+    Reads go straight to the unbuffered file object, skipping the
+    BufferedReader layer and the per-call bytes allocation.
+
+    Args:
+        length: Number of bytes to read
+
+    Returns:
+        View of the bytes read (shorter than ``length`` only at EOF); valid
+        until the next call
+    """
+    global _read_buffer
+    if length > len(_read_buffer):
+        _read_buffer = bytearray(length)
+
+    view = memoryview(_read_buffer)[:length]
+    stdin = sys.stdin.buffer.raw
+    received = 0
+    while received < length:
+        count = stdin.readinto(view[received:])
+        if not count:
+            break
+        received += count
+    return view[:received]
+
 
 class NativeMessagingProtocol:
     """Handles native messaging protocol encoding/decoding."""
@@ -28,7 +81,7 @@ class NativeMessagingProtocol:
         """
         try:
             # Read 4-byte message length (little-endian unsigned int)
-            raw_length = sys.stdin.buffer.read(4)
+            raw_length = _read_exact(4)
 
             if len(raw_length) == 0:
                 # stdin closed
@@ -39,18 +92,19 @@ class NativeMessagingProtocol:
                 return None
 
             # Unpack message length
-            message_length = struct.unpack('=I', raw_length)[0]
-
-            # Read the message
-            message_text = sys.stdin.buffer.read(message_length).decode('utf-8')
+            message_length = _LENGTH.unpack_from(raw_length)[0]
+            if message_length > MAX_MESSAGE_BYTES:
+                # The body can't be skipped reliably, so framing is lost
+                logger.error(f"Message too large: {message_length} bytes (max {MAX_MESSAGE_BYTES})")
+                return None
 
-            # Parse JSON
-            message = json.loads(message_text)
+            # Read the message and parse the UTF-8 JSON bytes directly
+            message = orjson.loads(_read_exact(message_length))
 
             logger.debug(f"Received message: {message.get('type', 'unknown')}")
             return message
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to decode JSON message: {e}")
             return None
         except Exception as e:
@@ -65,16 +119,8 @@ class NativeMessagingProtocol:
             message: Dictionary to send as JSON
         """
         try:
-            # Encode message as JSON
-            message_json = json.dumps(message)
-            message_bytes = message_json.encode('utf-8')
-
-            # Write message length (4 bytes, little-endian)
-            length = len(message_bytes)
-            sys.stdout.buffer.write(struct.pack('=I', length))
-
-            # Write message
-            sys.stdout.buffer.write(message_bytes)
+            # Write length prefix and message together
+            sys.stdout.buffer.write(encode_message(message))
             sys.stdout.buffer.flush()
 
             logger.debug(f"Sent message: {message.get('type', 'unknown')}")
@@ -82,15 +128,14 @@ class NativeMessagingProtocol:
         except Exception as e:
             logger.error(f"Error sending message: {e}")
 
-    @staticmethod
-    def send_error(error_message: str, error_code: str = "UNKNOWN_ERROR"):
+    def send_error(self, error_message: str, error_code: str = "UNKNOWN_ERROR"):
         """Send an error message.
 
         Args:
             error_message: Error description
             error_code: Error code
         """
-        NativeMessagingProtocol.send_message({
+        self.send_message({
             "type": "ERROR",
             "error": {
                 "code": error_code,
@@ -98,15 +143,14 @@ class NativeMessagingProtocol:
             }
         })
 
-    @staticmethod
-    def send_response(request_id: str, data: Dict[str, Any]):
+    def send_response(self, request_id: str, data: Dict[str, Any]):
         """Send a response to a request.
 
         Args:
             request_id: ID of the original request
             data: Response data
         """
-        NativeMessagingProtocol.send_message({
+        self.send_message({
             "type": "RESPONSE",
             "request_id": request_id,
             "data": data
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Export the sentence-transformer model to ONNX
+
+Converts the semantic classifier's model to ONNX with optimum and applies
+int8 dynamic quantization, so the classifier can run it through onnxruntime
+instead of PyTorch (see model/onnx_encoder.py). The classifier picks the
+export up automatically on its next start.
+
+Usage:
+    python scripts/export_onnx.py
+    python scripts/export_onnx.py --arm64          # Quantize for ARM (e.g. Apple Silicon)
+    python scripts/export_onnx.py --no-quantize    # Plain FP32 ONNX export
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from model.onnx_encoder import onnx_model_dir
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the semantic model to ONNX")
+    parser.add_argument(
+        "--model",
+        default="all-MiniLM-L6-v2",
+        help="Sentence transformer model name (default: all-MiniLM-L6-v2)"
+    )
+    parser.add_argument(
+        "--arm64",
+        action="store_true",
+        help="Quantize for ARM64 instead of x86-64 AVX-512 VNNI"
+    )
+    parser.add_argument(
+        "--no-quantize",
+        action="store_true",
+        help="Skip int8 quantization"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.error("optimum not installed. Run: pip install optimum[onnxruntime]")
+        sys.exit(1)
+
+    model_id = args.model if "/" in args.model else f"sentence-transformers/{args.model}"
+    output_dir = onnx_model_dir(args.model)
+
+    print("=" * 70)
+    print("  EXPORTING MODEL TO ONNX")
+    print("=" * 70)
+    print(f"Model:     {model_id}")
+    print(f"Quantize:  {'no' if args.no_quantize else ('arm64' if args.arm64 else 'avx512_vnni')}")
+    print(f"Output:    {output_dir}")
+    print("=" * 70)
+    print()
+
+    try:
+        model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_id)
+
+        if args.no_quantize:
+            model.save_pretrained(output_dir)
+        else:
+            # Quantize from a temporary FP32 export; only the int8 model is kept
+            with tempfile.TemporaryDirectory() as export_dir:
+                model.save_pretrained(export_dir)
+                quantizer = ORTQuantizer.from_pretrained(export_dir)
+                if args.arm64:
+                    qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+                else:
+                    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                quantizer.quantize(save_dir=output_dir, quantization_config=qconfig)
+
+        tokenizer.save_pretrained(output_dir)
+
+        print(f"✅ ONNX model saved to: {output_dir}")
+
+    except Exception as e:
+        logger.error(f"Failed to export model: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
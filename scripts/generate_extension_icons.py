@@ -3,19 +3,23 @@
 Generate placeholder icons for the browser extension
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw
 import os
+import shutil
 
 ICON_SIZES = [16, 48, 128]
 ICON_DIR = os.path.join(os.path.dirname(__file__), '..', 'extension', 'icons')
 BRAND_COLOR = '#4A90E2'
+# Icons are drawn once at this size and downscaled (supersampled edges)
+MASTER_SIZE = 256
 
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB tuple"""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-def create_icon(size: int, output_path: str):
+def create_icon(size: int) -> Image.Image:
     """Create a simple circular icon with checkmark"""
     # Create new image with transparency
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
@@ -49,9 +53,24 @@ def create_icon(size: int, output_path: str):
     y3 = size // 3
     draw.line([x2, y2, x3, y3], fill=checkmark_color, width=line_width)
 
-    # Save
-    img.save(output_path, 'PNG')
-    print(f'✓ Created {os.path.basename(output_path)} ({size}x{size})')
+    return img
+
+def save_icon(master: Image.Image, size: int):
+    """Downscale the master icon to one size and save it as PNG"""
+    output_path = os.path.join(ICON_DIR, f'icon{size}.png')
+    master.resize((size, size), Image.LANCZOS).save(output_path, 'PNG', optimize=True, compress_level=9)
+    return f'✓ Created {os.path.basename(output_path)} ({size}x{size})'
+
+def hardlink_or_copy(src: str, dst: str):
+    """Hard-link src to dst, copying instead across filesystems"""
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return  # Already linked; regenerating rewrites the shared inode
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
 def main():
     # Ensure icons directory exists
@@ -59,21 +78,23 @@ def main():
 
     print('Generating extension icons...')
 
-    for size in ICON_SIZES:
-        output_path = os.path.join(ICON_DIR, f'icon{size}.png')
-        create_icon(size, output_path)
+    master = create_icon(MASTER_SIZE)
+
+    # Resampling and PNG deflate release the GIL, so sizes encode in parallel
+    with ThreadPoolExecutor(max_workers=len(ICON_SIZES)) as executor:
+        for message in executor.map(lambda size: save_icon(master, size), ICON_SIZES):
+            print(message)
 
     # Also copy to dist if it exists
     dist_icon_dir = os.path.join(os.path.dirname(__file__), '..', 'extension', 'dist', 'icons')
     if os.path.exists(os.path.dirname(dist_icon_dir)):
         os.makedirs(dist_icon_dir, exist_ok=True)
         for size in ICON_SIZES:
+            # Just written above, so no existence check
             src = os.path.join(ICON_DIR, f'icon{size}.png')
             dst = os.path.join(dist_icon_dir, f'icon{size}.png')
-            if os.path.exists(src):
-                import shutil
-                shutil.copy(src, dst)
-                print(f'✓ Copied to dist/icons/icon{size}.png')
+            hardlink_or_copy(src, dst)
+            print(f'✓ Copied to dist/icons/icon{size}.png')
 
     print('\n✅ All icons generated successfully!')
     print(f'📁 Location: {ICON_DIR}')
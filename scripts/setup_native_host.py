@@ -8,15 +8,15 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from native_messaging.manifest_generator import ManifestGenerator
-from rich.console import Console
-from rich.panel import Panel
-
-console = Console()
-
 
 def main():
     """Main setup function."""
+    # Imported here so the script starts fast when it bails out early
+    from native_messaging.manifest_generator import ManifestGenerator
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console()
     console.print("\n[bold cyan]CircleNClick Native Messaging Host Setup[/bold cyan]\n")
 
     # Get project root
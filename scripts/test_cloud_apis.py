@@ -15,6 +15,7 @@ import argparse
 import asyncio
 import sys
 from pathlib import Path
+from typing import List
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -23,6 +24,7 @@ sys.path.insert(0, str(project_root))
 from cloud.google_factcheck import GoogleFactCheckClient
 from cloud.claimbuster import ClaimBusterClient
 from cloud.factiverse import FactiverseClient
+from cloud.base_client import close_http_client
 from utils.logger import get_logger
 from utils.config import settings
 
@@ -39,121 +41,121 @@ TEST_CLAIMS = [
 ]
 
 
-async def test_google_api(claim: str):
-    """Test Google Fact Check API"""
-    print("\n🔍 Testing Google Fact Check API...")
-    print("=" * 70)
+async def test_google_api(claim: str, report: List[str]):
+    """Test Google Fact Check API, appending its output lines to ``report``"""
+    report.append("\n🔍 Testing Google Fact Check API...")
+    report.append("=" * 70)
 
     client = GoogleFactCheckClient()
 
     if not client.is_configured:
-        print("❌ Google Fact Check API: NOT CONFIGURED")
-        print("   To configure:")
-        print("   1. Get API key from: https://console.cloud.google.com/")
-        print("   2. Add to .env file: GOOGLE_FACTCHECK_API_KEY=your_key_here")
-        print("   3. See docs/API_SETUP.md for detailed instructions")
+        report.append("❌ Google Fact Check API: NOT CONFIGURED")
+        report.append("   To configure:")
+        report.append("   1. Get API key from: https://console.cloud.google.com/")
+        report.append("   2. Add to .env file: GOOGLE_FACTCHECK_API_KEY=your_key_here")
+        report.append("   3. See docs/API_SETUP.md for detailed instructions")
         return False
 
     try:
-        print(f"✅ API Key: Configured ({client.api_key[:8]}...{client.api_key[-4:]})")
-        print(f"📝 Testing claim: \"{claim}\"")
-        print()
+        report.append(f"✅ API Key: Configured ({client.api_key[:8]}...{client.api_key[-4:]})")
+        report.append(f"📝 Testing claim: \"{claim}\"")
+        report.append("")
 
         result = await client.verify_claim(claim)
 
         if result:
-            print("✅ API Response: SUCCESS")
-            print(f"   Rating: {result.rating.value}")
-            print(f"   Confidence: {result.confidence}%")
-            print(f"   Sources: {len(result.sources)} fact-checker(s)")
+            report.append("✅ API Response: SUCCESS")
+            report.append(f"   Rating: {result.rating.value}")
+            report.append(f"   Confidence: {result.confidence}%")
+            report.append(f"   Sources: {len(result.sources)} fact-checker(s)")
             if result.sources:
-                print(f"   Top source: {result.sources[0].name}")
-            print(f"   Explanation: {result.explanation[:100]}...")
+                report.append(f"   Top source: {result.sources[0].name}")
+            report.append(f"   Explanation: {result.explanation[:100]}...")
             return True
         else:
-            print("⚠️  API Response: No fact-checks found for this claim")
-            print("   This is normal - not all claims have been fact-checked")
-            print("   Try a more well-known claim or recent news headline")
+            report.append("⚠️  API Response: No fact-checks found for this claim")
+            report.append("   This is normal - not all claims have been fact-checked")
+            report.append("   Try a more well-known claim or recent news headline")
             return True  # Still counts as working
 
     except Exception as e:
-        print(f"❌ API Error: {e}")
+        report.append(f"❌ API Error: {e}")
         logger.error(f"Google API test failed: {e}", exc_info=True)
         return False
 
 
-async def test_claimbuster_api(claim: str):
-    """Test ClaimBuster API"""
-    print("\n🔍 Testing ClaimBuster API...")
-    print("=" * 70)
+async def test_claimbuster_api(claim: str, report: List[str]):
+    """Test ClaimBuster API, appending its output lines to ``report``"""
+    report.append("\n🔍 Testing ClaimBuster API...")
+    report.append("=" * 70)
 
     client = ClaimBusterClient()
 
     if not client.is_configured:
-        print("❌ ClaimBuster API: NOT CONFIGURED")
-        print("   To configure:")
-        print("   1. Register at: https://idir.uta.edu/claimbuster/")
-        print("   2. Add to .env file: CLAIMBUSTER_API_KEY=your_key_here")
-        print("   3. See docs/API_SETUP.md for detailed instructions")
+        report.append("❌ ClaimBuster API: NOT CONFIGURED")
+        report.append("   To configure:")
+        report.append("   1. Register at: https://idir.uta.edu/claimbuster/")
+        report.append("   2. Add to .env file: CLAIMBUSTER_API_KEY=your_key_here")
+        report.append("   3. See docs/API_SETUP.md for detailed instructions")
         return False
 
     try:
-        print(f"✅ API Key: Configured ({client.api_key[:8]}...{client.api_key[-4:]})")
-        print(f"📝 Testing claim: \"{claim}\"")
-        print()
+        report.append(f"✅ API Key: Configured ({client.api_key[:8]}...{client.api_key[-4:]})")
+        report.append(f"📝 Testing claim: \"{claim}\"")
+        report.append("")
 
         result = await client.verify_claim(claim)
 
         if result:
-            print("✅ API Response: SUCCESS")
-            print(f"   Rating: {result.rating.value}")
-            print(f"   Confidence: {result.confidence}%")
-            print(f"   Explanation: {result.explanation[:100]}...")
+            report.append("✅ API Response: SUCCESS")
+            report.append(f"   Rating: {result.rating.value}")
+            report.append(f"   Confidence: {result.confidence}%")
+            report.append(f"   Explanation: {result.explanation[:100]}...")
             return True
         else:
-            print("⚠️  API Response: No results")
+            report.append("⚠️  API Response: No results")
             return True  # Still counts as working
 
     except Exception as e:
-        print(f"❌ API Error: {e}")
+        report.append(f"❌ API Error: {e}")
         logger.error(f"ClaimBuster API test failed: {e}", exc_info=True)
         return False
 
 
-async def test_factiverse_api(claim: str):
-    """Test Factiverse API"""
-    print("\n🔍 Testing Factiverse API...")
-    print("=" * 70)
+async def test_factiverse_api(claim: str, report: List[str]):
+    """Test Factiverse API, appending its output lines to ``report``"""
+    report.append("\n🔍 Testing Factiverse API...")
+    report.append("=" * 70)
 
     client = FactiverseClient()
 
     if not client.is_configured:
-        print("❌ Factiverse API: NOT CONFIGURED")
-        print("   To configure:")
-        print("   1. Contact: https://www.factiverse.ai/")
-        print("   2. Add to .env file: FACTIVERSE_API_KEY=your_key_here")
-        print("   3. See docs/API_SETUP.md for detailed instructions")
+        report.append("❌ Factiverse API: NOT CONFIGURED")
+        report.append("   To configure:")
+        report.append("   1. Contact: https://www.factiverse.ai/")
+        report.append("   2. Add to .env file: FACTIVERSE_API_KEY=your_key_here")
+        report.append("   3. See docs/API_SETUP.md for detailed instructions")
         return False
 
     try:
-        print(f"✅ API Key: Configured ({client.api_key[:8]}...{client.api_key[-4:]})")
-        print(f"📝 Testing claim: \"{claim}\"")
-        print()
+        report.append(f"✅ API Key: Configured ({client.api_key[:8]}...{client.api_key[-4:]})")
+        report.append(f"📝 Testing claim: \"{claim}\"")
+        report.append("")
 
         result = await client.verify_claim(claim)
 
         if result:
-            print("✅ API Response: SUCCESS")
-            print(f"   Rating: {result.rating.value}")
-            print(f"   Confidence: {result.confidence}%")
-            print(f"   Explanation: {result.explanation[:100]}...")
+            report.append("✅ API Response: SUCCESS")
+            report.append(f"   Rating: {result.rating.value}")
+            report.append(f"   Confidence: {result.confidence}%")
+            report.append(f"   Explanation: {result.explanation[:100]}...")
             return True
         else:
-            print("⚠️  API Response: No results")
+            report.append("⚠️  API Response: No results")
             return True  # Still counts as working
 
     except Exception as e:
-        print(f"❌ API Error: {e}")
+        report.append(f"❌ API Error: {e}")
         logger.error(f"Factiverse API test failed: {e}", exc_info=True)
         return False
 
@@ -200,20 +202,38 @@ async def main():
         print("3. See docs/API_SETUP.md for instructions")
         print("\nContinuing with tests to show configuration status...\n")
 
-    results = {}
-
-    # Test APIs based on flags
+    # Tests selected by the --*-only flags (all of them by default)
+    api_tests = {
+        "Google": test_google_api,
+        "ClaimBuster": test_claimbuster_api,
+        "Factiverse": test_factiverse_api
+    }
     if args.google_only:
-        results["Google"] = await test_google_api(test_claim)
+        api_tests = {"Google": test_google_api}
     elif args.claimbuster_only:
-        results["ClaimBuster"] = await test_claimbuster_api(test_claim)
+        api_tests = {"ClaimBuster": test_claimbuster_api}
     elif args.factiverse_only:
-        results["Factiverse"] = await test_factiverse_api(test_claim)
-    else:
-        # Test all APIs
-        results["Google"] = await test_google_api(test_claim)
-        results["ClaimBuster"] = await test_claimbuster_api(test_claim)
-        results["Factiverse"] = await test_factiverse_api(test_claim)
+        api_tests = {"Factiverse": test_factiverse_api}
+
+    # Run the independent API calls concurrently; each test buffers its
+    # output so the reports don't interleave
+    reports = {api_name: [] for api_name in api_tests}
+    try:
+        outcomes = await asyncio.gather(
+            *(test(test_claim, reports[api_name]) for api_name, test in api_tests.items()),
+            return_exceptions=True
+        )
+    finally:
+        await close_http_client()
+
+    results = {}
+    for api_name, outcome in zip(api_tests, outcomes):
+        print("\n".join(reports[api_name]))
+        if isinstance(outcome, Exception):
+            print(f"❌ API Error: {outcome}")
+            logger.error(f"{api_name} API test failed: {outcome}")
+            outcome = False
+        results[api_name] = outcome
 
     # Summary
     print("\n" + "=" * 70)
@@ -11,143 +11,111 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-
-def send_message(proc, message):
-    """Send a message to the native host."""
-    message_json = json.dumps(message)
-    message_bytes = message_json.encode('utf-8')
-    length = len(message_bytes)
-
-    # Write length (4 bytes, little-endian)
-    proc.stdin.write(struct.pack('=I', length))
-    # Write message
-    proc.stdin.write(message_bytes)
-    proc.stdin.flush()
-
-
-def read_message(proc):
-    """Read a message from the native host."""
-    # Read length
-    raw_length = proc.stdout.read(4)
-    if len(raw_length) == 0:
-        return None
-
-    length = struct.unpack('=I', raw_length)[0]
-
-    # Read message
-    message_bytes = proc.stdout.read(length)
-    message_json = message_bytes.decode('utf-8')
-    return json.loads(message_json)
+# Message length prefix: 4-byte unsigned int in native byte order
+_HDR = struct.Struct('=I')
+
+
+class NativeHostFixture:
+    """One native host process shared by all tests.
+
+    Native messaging is a persistent stdio protocol, so the tests talk to a
+    single host instead of paying interpreter and engine startup per test.
+    """
+
+    def __init__(self):
+        """Initialize the fixture; the host starts on ``__enter__``."""
+        self.host_script = project_root / "native_messaging" / "host.py"
+        self.proc = None
+
+    def __enter__(self):
+        # stderr is discarded: an unread pipe would block a long-lived host.
+        # The 64 KB buffer lets one read syscall serve a response's length
+        # prefix and body together.
+        self.proc = subprocess.Popen(
+            [sys.executable, str(self.host_script)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=65536
+        )
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+    def send_message(self, message):
+        """Send a message to the native host."""
+        message_bytes = json.dumps(message).encode('utf-8')
+
+        # Length (4 bytes, native byte order) and message in one write
+        self.proc.stdin.write(_HDR.pack(len(message_bytes)) + message_bytes)
+        self.proc.stdin.flush()
+
+    def read_message(self):
+        """Read a message from the native host."""
+        # Read length
+        raw_length = self.proc.stdout.read(_HDR.size)
+        if len(raw_length) == 0:
+            return None
+
+        length = _HDR.unpack_from(raw_length)[0]
+
+        # Read message
+        message_bytes = self.proc.stdout.read(length)
+        return json.loads(message_bytes.decode('utf-8'))
+
+
+def run_request(host, message):
+    """Send one request and report its response."""
+    host.send_message(message)
+    response = host.read_message()
+
+    if response:
+        print(f"✓ Response: {json.dumps(response, indent=2)}")
+        return True
+    else:
+        print("✗ No response received")
+        return False
 
 
-def test_ping():
+def test_ping(host):
     """Test ping request."""
     print("\n📌 Testing PING request...")
 
-    host_script = project_root / "native_messaging" / "host.py"
-
-    proc = subprocess.Popen(
-        [sys.executable, str(host_script)],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-
-    try:
-        # Send PING
-        send_message(proc, {
-            "type": "PING",
-            "request_id": "test-ping-1"
-        })
-
-        # Read response
-        response = read_message(proc)
+    return run_request(host, {
+        "type": "PING",
+        "request_id": "test-ping-1"
+    })
 
-        if response:
-            print(f"✓ Response: {json.dumps(response, indent=2)}")
-            return True
-        else:
-            print("✗ No response received")
-            return False
 
-    finally:
-        proc.terminate()
-        proc.wait(timeout=2)
-
-
-def test_verify():
+def test_verify(host):
     """Test verification request."""
     print("\n📌 Testing VERIFY request...")
 
-    host_script = project_root / "native_messaging" / "host.py"
-
-    proc = subprocess.Popen(
-        [sys.executable, str(host_script)],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-
-    try:
-        # Send VERIFY
-        send_message(proc, {
-            "type": "VERIFY",
-            "request_id": "test-verify-1",
-            "data": {
-                "text": "The Earth is flat",
-                "platform": "test",
-                "strategy": "local"
-            }
-        })
-
-        # Read response
-        response = read_message(proc)
-
-        if response:
-            print(f"✓ Response: {json.dumps(response, indent=2)}")
-            return True
-        else:
-            print("✗ No response received")
-            return False
-
-    finally:
-        proc.terminate()
-        proc.wait(timeout=2)
-
-
-def test_status():
-    """Test status request."""
-    print("\n📌 Testing GET_STATUS request...")
-
-    host_script = project_root / "native_messaging" / "host.py"
+    return run_request(host, {
+        "type": "VERIFY",
+        "request_id": "test-verify-1",
+        "data": {
+            "text": "The Earth is flat",
+            "platform": "test",
+            "strategy": "local"
+        }
+    })
 
-    proc = subprocess.Popen(
-        [sys.executable, str(host_script)],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
 
-    try:
-        # Send GET_STATUS
-        send_message(proc, {
-            "type": "GET_STATUS",
-            "request_id": "test-status-1"
-        })
-
-        # Read response
-        response = read_message(proc)
-
-        if response:
-            print(f"✓ Response: {json.dumps(response, indent=2)}")
-            return True
-        else:
-            print("✗ No response received")
-            return False
+def test_status(host):
+    """Test status request."""
+    print("\n📌 Testing GET_STATUS request...")
 
-    finally:
-        proc.terminate()
-        proc.wait(timeout=2)
+    return run_request(host, {
+        "type": "GET_STATUS",
+        "request_id": "test-status-1"
+    })
 
 
 def main():
@@ -158,10 +126,11 @@ def main():
 
     results = []
 
-    # Run tests
-    results.append(("PING", test_ping()))
-    results.append(("VERIFY", test_verify()))
-    results.append(("STATUS", test_status()))
+    # Run tests against one host process
+    with NativeHostFixture() as host:
+        results.append(("PING", test_ping(host)))
+        results.append(("VERIFY", test_verify(host)))
+        results.append(("STATUS", test_status(host)))
 
     # Summary
     print("\n" + "=" * 60)
@@ -9,11 +9,12 @@ Example:
     python scripts/update_extension_id.py abcdefghijklmnopqrstuvwxyz123456
 """
 
-import json
 import sys
 import os
 from pathlib import Path
 
+import orjson
+
 def update_chrome_manifest(extension_id: str):
     """Update Chrome native messaging manifest with extension ID"""
 
@@ -35,15 +36,21 @@ def update_chrome_manifest(extension_id: str):
 
     # Update manifest
     try:
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        with open(manifest_path, 'rb') as f:
+            manifest = orjson.loads(f.read())
 
         old_origins = manifest.get('allowed_origins', [])
         new_origin = f"chrome-extension://{extension_id}/"
         manifest['allowed_origins'] = [new_origin]
 
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        # Write a temp file and swap it in, so the manifest is never seen
+        # truncated or half-written
+        tmp_path = manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_path)
 
         print(f"✅ Updated Chrome manifest")
         print(f"   Old: {old_origins}")
@@ -1,23 +1,227 @@
 """Caching layer for verification results."""
 
+import copy
 import hashlib
-import json
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import heapq
+import pickle
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Union
 from pathlib import Path
 
 from diskcache import Cache
 
-from core.models import VerificationResult, Verdict
-from core.hybrid_decisor import VerificationStrategy
+from core.models import VerificationResult
 from utils.config import settings
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Optional LMDB backend: lock-free concurrent readers (MVCC)
+try:
+    import lmdb
+    LMDB_AVAILABLE = True
+except ImportError:
+    LMDB_AVAILABLE = False
+
+# Cached value for a recent "no source had a result" outcome (see
+# VerificationCache.set_negative); stored as an empty blob
+NEGATIVE = object()
+
+
+def _private_copy(result: Union[VerificationResult, object]) -> Union[VerificationResult, object]:
+    """Deep-copy a result so no two holders share its lists or metadata.
+
+    Args:
+        result: Verification result, or NEGATIVE (returned as is)
+
+    Returns:
+        Independent copy of the result
+    """
+    return result if result is NEGATIVE else copy.deepcopy(result)
+
+
+# LMDB allows one open environment per path and process; shared by path
+_lmdb_environments: Dict[str, Any] = {}
+_lmdb_lock = threading.Lock()
+
+# LMDB value header: stored_at and ttl_seconds, followed by the pickled result
+_ENTRY_HEADER = struct.Struct('=dd')
+
+
+class LmdbBackend:
+    """LMDB store exposing the subset of the diskcache.Cache API used here.
+
+    Values are ``(stored_at, ttl_seconds, blob)`` tuples, stored as a fixed
+    header plus the blob so no second pickling layer is needed.
+    """
+
+    # Start evicting at this share of the map. Deleting needs free pages
+    # too, so waiting for MapFullError would leave no room to evict in
+    _EVICT_AT = 0.8
+    # Keys deleted per write transaction when evicting
+    _EVICT_BATCH = 16
+
+    def __init__(self, directory: Path, size_limit: int):
+        """Open (or create) the LMDB environment.
+
+        Args:
+            directory: Environment directory
+            size_limit: Maximum database size in bytes
+        """
+        path = str(directory)
+        with _lmdb_lock:
+            if path not in _lmdb_environments:
+                _lmdb_environments[path] = lmdb.open(path, map_size=size_limit, max_readers=128)
+            self.env = _lmdb_environments[path]
+        self._evict_at = size_limit * self._EVICT_AT
+
+    def get(self, key: str) -> Optional[Tuple[float, float, bytes]]:
+        """Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored tuple or None if missing
+        """
+        with self.env.begin() as txn:
+            value = txn.get(key.encode())
+        if value is None:
+            return None
+        stored_at, ttl_seconds = _ENTRY_HEADER.unpack_from(value)
+        return stored_at, ttl_seconds, memoryview(value)[_ENTRY_HEADER.size:]
+
+    def set(self, key: str, value: Tuple[float, float, bytes], expire: Optional[float] = None):
+        """Store an entry, evicting old ones as the map fills up.
+
+        Expiry is checked on read (``expire`` is accepted for diskcache
+        compatibility). Past ``_EVICT_AT`` of the map, expired entries and
+        then the oldest ones are dropped first, gradually like diskcache.
+
+        Args:
+            key: Cache key
+            value: (stored_at, ttl_seconds, blob)
+            expire: Unused
+        """
+        stored_at, ttl_seconds, blob = value
+        data = _ENTRY_HEADER.pack(stored_at, ttl_seconds) + blob
+
+        if self._used_bytes() > self._evict_at:
+            self._make_room()
+
+        while True:
+            try:
+                with self.env.begin(write=True) as txn:
+                    txn.put(key.encode(), data)
+                return
+            except lmdb.MapFullError:
+                # Free pages can be too fragmented for a large value
+                if not self._evict_oldest():
+                    raise
+
+    def delete(self, key: str):
+        """Delete an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self.env.begin(write=True) as txn:
+            txn.delete(key.encode())
+
+    def clear(self):
+        """Delete all entries."""
+        with self.env.begin(write=True) as txn:
+            txn.drop(self.env.open_db(txn=txn), delete=False)
+
+    def volume(self) -> int:
+        """Get the bytes used by the database.
+
+        Returns:
+            Size in bytes
+        """
+        return (self.env.info()["last_pgno"] + 1) * self.env.stat()["psize"]
+
+    def __len__(self) -> int:
+        return self.env.stat()["entries"]
+
+    def _used_bytes(self) -> int:
+        """Get the bytes held by live entries (freed pages not counted).
+
+        Returns:
+            Size in bytes
+        """
+        stat = self.env.stat()
+        return (stat["branch_pages"] + stat["leaf_pages"] + stat["overflow_pages"]) * stat["psize"]
+
+    def _make_room(self):
+        """Drop expired entries, then the oldest ones while still over the mark."""
+        try:
+            self._purge_expired()
+        except lmdb.MapFullError:
+            pass  # Eviction below falls back to clearing
+        while self._used_bytes() > self._evict_at and self._evict_oldest():
+            pass
+
+    def _purge_expired(self):
+        """Delete every expired entry."""
+        now = time.time()
+        with self.env.begin(write=True) as txn:
+            cursor = txn.cursor()
+            for key, value in cursor:
+                stored_at, ttl_seconds = _ENTRY_HEADER.unpack_from(value)
+                if now - stored_at > ttl_seconds:
+                    txn.delete(key)
+
+    def _evict_oldest(self, fraction: float = 0.1) -> bool:
+        """Delete the oldest entries by ``stored_at``.
+
+        Deletes copy every leaf page they touch, and keys are spread over
+        the whole tree, so they are committed in small batches; the pages
+        each batch frees are reused by the next.
+
+        Args:
+            fraction: Share of the entries to delete (at least one)
+
+        Returns:
+            False if there was nothing left to delete
+        """
+        with self.env.begin() as txn:
+            entries = [
+                (_ENTRY_HEADER.unpack_from(value)[0], bytes(key))
+                for key, value in txn.cursor()
+            ]
+        if not entries:
+            return False
+
+        oldest = [key for _, key in heapq.nsmallest(max(1, int(len(entries) * fraction)), entries)]
+        try:
+            for start in range(0, len(oldest), self._EVICT_BATCH):
+                with self.env.begin(write=True) as txn:
+                    for key in oldest[start:start + self._EVICT_BATCH]:
+                        txn.delete(key)
+        except lmdb.MapFullError:
+            # Not even a delete fits any more; only dropping the table does
+            logger.warning("LMDB cache full with no room to evict, clearing it")
+            self.clear()
+        return True
+
 
 class VerificationCache:
-    """Cache for verification results to reduce API calls."""
+    """Cache for verification results to reduce API calls.
+
+    Hot entries are kept in a bounded in-process LRU in front of the disk
+    cache, and disk writes happen on a background thread.
+    """
+
+    # Entries kept in the in-process LRU
+    memory_entries = 1024
+    # How long stats() reuses its last disk scan
+    stats_ttl_seconds = 5.0
 
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize cache.
@@ -28,16 +232,44 @@ class VerificationCache:
         self.cache_dir = cache_dir or settings.cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize disk cache
-        self.cache = Cache(
-            directory=str(self.cache_dir),
-            size_limit=settings.max_cache_size_mb * 1024 * 1024  # Convert MB to bytes
-        )
+        # Initialize disk cache (LMDB when installed, diskcache otherwise)
+        size_limit = settings.max_cache_size_mb * 1024 * 1024  # Convert MB to bytes
+        if LMDB_AVAILABLE:
+            self.cache = LmdbBackend(self.cache_dir / "verification.lmdb", size_limit)
+        else:
+            self.cache = Cache(directory=str(self.cache_dir), size_limit=size_limit)
+
+        # key -> (monotonic expiry, result); guarded by a lock since the
+        # cache is also used from worker threads
+        self._mem: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._mem_lock = threading.Lock()
+        # One writer thread keeps disk writes ordered and off the request path
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+        self.default_ttl_seconds = settings.cache_ttl_hours * 3600
+        # (monotonic time, stats) of the last stats() scan
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
         self.logger = logger
         self.logger.info(f"Cache initialized at {self.cache_dir}")
 
-    def _generate_key(self, text: str) -> str:
+    def _remember(self, key: str, result: Union[VerificationResult, object], ttl_seconds: float):
+        """Put a result in the in-process LRU.
+
+        Args:
+            key: Cache key
+            result: Verification result, or NEGATIVE
+            ttl_seconds: Remaining lifetime of the entry
+        """
+        with self._mem_lock:
+            self._mem[key] = (time.monotonic() + ttl_seconds, result)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.memory_entries:
+                self._mem.popitem(last=False)
+
+    # get() and set() key the same text on every miss, so hash it once
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _generate_key(text: str) -> str:
         """Generate cache key from text.
 
         Args:
@@ -49,8 +281,21 @@ class VerificationCache:
         # Normalize text (lowercase, strip whitespace)
         normalized = text.lower().strip()
 
-        # Generate SHA256 hash
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        # 128-bit BLAKE2b: faster than SHA-256 and half the key size
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def _negative_key(cls, text: str, scope: str) -> str:
+        """Generate the key of a negative entry.
+
+        Args:
+            text: Text that was verified
+            scope: What came back empty (e.g. the verification strategy)
+
+        Returns:
+            Cache key, distinct from the result key of the same text
+        """
+        return f"{cls._generate_key(text)}:{scope}"
 
     def get(self, text: str) -> Optional[VerificationResult]:
         """Get cached verification result.
@@ -61,126 +306,187 @@ class VerificationCache:
         Returns:
             Cached VerificationResult or None if not found/expired
         """
-        key = self._generate_key(text)
+        result = self._lookup(self._generate_key(text))
+        return None if result is NEGATIVE else result
+
+    def is_negative(self, text: str, scope: str) -> bool:
+        """Check whether verifying text recently produced no results.
+
+        Args:
+            text: Text to look up
+            scope: Scope given to set_negative()
+
+        Returns:
+            True while a negative entry from set_negative() is fresh
+        """
+        return self._lookup(self._negative_key(text, scope)) is NEGATIVE
+
+    def _lookup(self, key: str) -> Union[VerificationResult, object, None]:
+        """Look up an entry in memory, then on disk.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached VerificationResult, NEGATIVE, or None if not found/expired
+        """
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                if time.monotonic() >= entry[0]:
+                    del self._mem[key]
+                    entry = None
+                else:
+                    self._mem.move_to_end(key)
+        if entry is not None:
+            self.logger.debug(f"Memory cache hit for key {key[:16]}...")
+            # Callers get their own copy; the remembered one stays untouched
+            return _private_copy(entry[1])
 
         try:
             cached_data = self.cache.get(key)
 
-            if cached_data is None:
+            # Entries are (stored_at, ttl_seconds, pickled result); anything
+            # else is from an older cache format
+            if not isinstance(cached_data, tuple):
+                if cached_data is not None:
+                    self.cache.delete(key)
                 self.logger.debug(f"Cache miss for key {key[:16]}...")
                 return None
 
-            # Check if expired
-            cached_time = datetime.fromisoformat(cached_data["timestamp"])
-            ttl = timedelta(hours=settings.cache_ttl_hours)
+            # Check if expired (plain float math on wall-clock seconds)
+            stored_at, ttl_seconds, blob = cached_data
+            age = time.time() - stored_at
 
-            if datetime.now() - cached_time > ttl:
+            if age > ttl_seconds:
                 self.logger.debug(f"Cache expired for key {key[:16]}...")
                 self.cache.delete(key)
                 return None
 
-            # Reconstruct VerificationResult
-            result = self._deserialize_result(cached_data)
+            result = pickle.loads(blob) if len(blob) else NEGATIVE
+            self._remember(key, result, ttl_seconds - age)
 
-            self.logger.info(f"Cache hit for key {key[:16]}... (age: {datetime.now() - cached_time})")
-            return result
+            self.logger.info(f"Cache hit for key {key[:16]}... (age: {age:.0f}s)")
+            return _private_copy(result)
 
         except Exception as e:
             self.logger.error(f"Error reading from cache: {e}")
             return None
 
-    def set(self, text: str, result: VerificationResult):
+    def set(self, text: str, result: VerificationResult, ttl: Optional[int] = None):
         """Store verification result in cache.
 
+        The result is served from memory immediately; the disk write is
+        queued on the writer thread.
+
         Args:
             text: Text that was verified
             result: Verification result to cache
+            ttl: Time to live in seconds (uses settings.cache_ttl_hours if not provided)
         """
         key = self._generate_key(text)
 
         try:
-            # Serialize result
-            cached_data = self._serialize_result(result)
+            if ttl is None:
+                ttl = self.default_ttl_seconds
 
-            # Store in cache
-            self.cache.set(key, cached_data)
+            # Deep copy, lists and metadata included, so later changes by the
+            # caller don't leak into the cache or race the writer's pickling
+            snapshot = copy.deepcopy(result)
+            self._remember(key, snapshot, ttl)
 
-            self.logger.info(f"Cached result for key {key[:16]}... (verdict: {result.verdict.value})")
+            # Pickled and stored on the writer thread; diskcache also evicts
+            # the entry once it expires
+            self._writer.submit(self._write, key, snapshot, ttl, time.time())
+
+            self.logger.info(f"Cached result for key {key[:16]}... (verdict: {result.verdict.value}, ttl: {ttl}s)")
 
         except Exception as e:
             self.logger.error(f"Error writing to cache: {e}")
 
+    def set_negative(self, text: str, scope: str, ttl: int = 3600):
+        """Remember that verifying text produced no results.
+
+        Until the entry expires, is_negative() returns True for the same text
+        and scope so callers can skip the sources that just came back empty.
+        Other scopes (e.g. a different strategy) are not affected.
+
+        Args:
+            text: Text that was verified
+            scope: What came back empty (e.g. the verification strategy)
+            ttl: Time to live in seconds
+        """
+        key = self._negative_key(text, scope)
+        self._remember(key, NEGATIVE, ttl)
+        self._writer.submit(self._write, key, NEGATIVE, ttl, time.time())
+        self.logger.info(f"Cached negative result for key {key[:16]}... (scope: {scope}, ttl: {ttl}s)")
+
+    def _write(self, key: str, result: Union[VerificationResult, object], ttl: int, stored_at: float):
+        """Write an entry to disk (runs on the writer thread).
+
+        The result is pickled once here (protocol 5) and stored as bytes, so
+        diskcache keeps the blob as is instead of pickling a dict of
+        converted fields.
+
+        Args:
+            key: Cache key
+            result: Verification result, or NEGATIVE
+            ttl: Time to live in seconds
+            stored_at: Wall-clock time the result was cached
+        """
+        try:
+            blob = b"" if result is NEGATIVE else pickle.dumps(result, protocol=5)
+            self.cache.set(key, (stored_at, ttl, blob), expire=ttl)
+        except Exception as e:
+            self.logger.error(f"Error writing to cache: {e}")
+
     def clear(self):
         """Clear all cached results."""
+        with self._mem_lock:
+            self._mem.clear()
+        self._stats_cache = None
         try:
+            # Let queued writes land first so they can't resurrect entries
+            self._writer.submit(lambda: None).result()
             self.cache.clear()
             self.logger.info("Cache cleared")
         except Exception as e:
             self.logger.error(f"Error clearing cache: {e}")
 
-    def stats(self) -> Dict[str, Any]:
+    def stats(self, force_fresh: bool = False) -> Dict[str, Any]:
         """Get cache statistics.
 
+        Counting entries and measuring volume touches the disk backend, so
+        results are reused for ``stats_ttl_seconds`` to keep status polling
+        cheap.
+
+        Args:
+            force_fresh: Rescan even if recent stats are available
+
         Returns:
             Dictionary with cache stats
         """
+        cached = self._stats_cache
+        if not force_fresh and cached is not None and time.monotonic() - cached[0] < self.stats_ttl_seconds:
+            return cached[1]
+
         try:
             volume = self.cache.volume()
             size_mb = volume / (1024 * 1024)
 
-            return {
+            stats = {
                 "size_mb": round(size_mb, 2),
                 "item_count": len(self.cache),
                 "cache_dir": str(self.cache_dir),
                 "ttl_hours": settings.cache_ttl_hours,
                 "max_size_mb": settings.max_cache_size_mb
             }
+            self._stats_cache = (time.monotonic(), stats)
+            return stats
         except Exception as e:
             self.logger.error(f"Error getting cache stats: {e}")
             return {}
 
-    def _serialize_result(self, result: VerificationResult) -> Dict[str, Any]:
-        """Serialize VerificationResult to dict for caching.
-
-        Args:
-            result: VerificationResult to serialize
-
-        Returns:
-            Serializable dictionary
-        """
-        return {
-            "verdict": result.verdict.value,
-            "confidence": result.confidence,
-            "explanation": result.explanation,
-            "sources": result.sources,
-            "evidence": result.evidence,
-            "strategy_used": result.strategy_used.value if result.strategy_used else None,
-            "processing_time": result.processing_time,
-            "timestamp": result.timestamp.isoformat(),
-            "metadata": result.metadata
-        }
-
-    def _deserialize_result(self, data: Dict[str, Any]) -> VerificationResult:
-        """Deserialize dict to VerificationResult.
-
-        Args:
-            data: Serialized result data
-
-        Returns:
-            VerificationResult instance
-        """
-        return VerificationResult(
-            verdict=Verdict(data["verdict"]),
-            confidence=data["confidence"],
-            explanation=data["explanation"],
-            sources=data["sources"],
-            evidence=data["evidence"],
-            strategy_used=VerificationStrategy(data["strategy_used"]) if data.get("strategy_used") else None,
-            processing_time=data["processing_time"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            metadata=data.get("metadata", {})
-        )
-
 
 # Global cache instance
 cache = VerificationCache()
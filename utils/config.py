@@ -1,9 +1,17 @@
 """Configuration management for CircleNClick."""
 
+import logging
+import os
+import pickle
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Directories already known to exist in this process
+_dirs_ready: Set[Path] = set()
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -30,6 +38,11 @@ class Settings(BaseSettings):
     api_host: str = "localhost"
     api_port: int = 8080
     api_reload: bool = True
+    api_workers: int = os.cpu_count() or 2  # Ignored when api_reload is on
+    cors_allowed_origins: List[str] = [
+        "http://localhost:8080",
+        "http://127.0.0.1:8080"
+    ]
 
     # Model Settings
     model_confidence_threshold: float = 0.7
@@ -41,40 +54,60 @@ class Settings(BaseSettings):
     cloud_timeout_seconds: int = 15
     max_concurrent_requests: int = 5
 
+    # Native Messaging
+    native_host_daemon: bool = True  # Keep a warm engine in a shared daemon
+
     # Logging
     log_level: str = "INFO"
     log_file: str = "logs/circlenclick.log"
+    log_queue_size: int = 10000  # Records buffered for the log writer before dropping
+    log_socket_host: Optional[str] = None  # Send the app log to utils/log_server.py
+    log_socket_port: int = 9020
 
     # Development
     debug: bool = False
     testing: bool = False
 
-    # Paths
-    @property
+    @field_validator("log_level")
+    @classmethod
+    def validate_log_level(cls, value: str) -> str:
+        """Normalize the log level and reject unknown names at load time."""
+        level = value.upper()
+        if level not in logging.getLevelNamesMapping():
+            raise ValueError(f"Unknown log level: {value}")
+        return level
+
+    # Paths (fixed for the process, so each is built once; pydantic
+    # leaves cached_property alone and it stores into the instance dict)
+    @cached_property
     def project_root(self) -> Path:
         """Get the project root directory."""
         return Path(__file__).parent.parent
 
-    @property
+    @cached_property
     def models_dir(self) -> Path:
         """Get the models directory."""
         return self.project_root / "model" / "weights"
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Get the cache directory."""
         return self.project_root / "cache"
 
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Get the logs directory."""
         return self.project_root / "logs"
 
     def ensure_directories(self):
         """Create necessary directories if they don't exist."""
-        self.models_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (self.models_dir, self.cache_dir, self.logs_dir):
+            if directory in _dirs_ready:
+                continue
+            # A stat is cheaper than a mkdir that fails with EEXIST
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+            _dirs_ready.add(directory)
 
     def has_cloud_apis(self) -> bool:
         """Check if any cloud API keys are configured."""
@@ -87,8 +120,40 @@ class Settings(BaseSettings):
         ])
 
 
+def _load_settings() -> Settings:
+    """Build the settings, reusing a pickled copy when CNC_FAST_SETTINGS is set.
+
+    The fast path skips .env parsing and pydantic validation for short-lived
+    scripts. It only applies while .env.cache is newer than .env, and it
+    ignores environment variables changed since the cache was written, so
+    it is opt-in.
+
+    Returns:
+        Settings instance
+    """
+    if not os.environ.get("CNC_FAST_SETTINGS"):
+        return Settings()
+
+    env_path = Path(".env")
+    cache_path = Path(".env.cache")
+    try:
+        if env_path.exists() and cache_path.stat().st_mtime > env_path.stat().st_mtime:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError):
+        pass  # Missing or stale/unreadable cache: rebuild below
+
+    loaded = Settings()
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(loaded, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return loaded
+
+
 # Global settings instance
-settings = Settings()
+settings = _load_settings()
 
 # Ensure directories exist
 settings.ensure_directories()
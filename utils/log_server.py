@@ -0,0 +1,75 @@
+"""Log server for multi-process deployments.
+
+With several API workers, each process rotating the same log file races
+with the others. Setting ``LOG_SOCKET_HOST`` makes every process send its
+application log records to this server instead (via
+``logging.handlers.SocketHandler``), and the server is the only writer of
+the rotating log file.
+
+Records arrive as pickles, so the server must only listen on an interface
+reachable by trusted processes (localhost by default).
+
+Usage:
+    python -m utils.log_server
+"""
+
+import logging
+import pickle
+import socketserver
+import struct
+
+from utils.config import settings
+from utils.logger import create_file_handler
+
+# SocketHandler frames each pickled record with a 4-byte big-endian length
+_LENGTH = struct.Struct(">L")
+
+
+class LogRecordStreamHandler(socketserver.StreamRequestHandler):
+    """Reads pickled log records from one connected process."""
+
+    def handle(self):
+        while True:
+            header = self.rfile.read(_LENGTH.size)
+            if len(header) < _LENGTH.size:
+                break  # Process disconnected
+
+            body = self.rfile.read(_LENGTH.unpack(header)[0])
+            record = logging.makeLogRecord(pickle.loads(body))
+            self.server.file_handler.handle(record)
+
+
+class LogRecordServer(socketserver.ThreadingTCPServer):
+    """TCP server writing every received record to one file handler."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, host: str, port: int, file_handler: logging.Handler):
+        """Initialize the server.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port
+            file_handler: Handler that writes the records
+        """
+        super().__init__((host, port), LogRecordStreamHandler)
+        self.file_handler = file_handler
+
+
+def main():
+    host = settings.log_socket_host or "localhost"
+    file_handler = create_file_handler(settings.log_file)
+
+    with LogRecordServer(host, settings.log_socket_port, file_handler) as server:
+        print(f"Log server writing {settings.log_file}, listening on {host}:{settings.log_socket_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            file_handler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,345 @@
 """Logging configuration for CircleNClick."""
 
+import atexit
+import functools
 import logging
+import os
+import queue
 import sys
-from pathlib import Path
-from typing import Optional
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from typing import List, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, SocketHandler
 
 from utils.config import settings
 
+# Neither formatter shows thread/process fields, so skip collecting them
+# (current_thread()/getpid() calls) for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+# Nor the caller's file/line: without a source file, findCaller returns
+# at once instead of walking the stack per record
+logging._srcfile = None
+
+# Level name -> number, e.g. "INFO" -> 20
+_LEVELS = logging.getLevelNamesMapping()
+
+# Background threads doing the actual console/file writes, one per
+# configured logger; stopped (and drained) at exit
+listeners: List[QueueListener] = []
+
+
+def _stop_listeners():
+    """Stop every listener, flushing records still queued."""
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(_stop_listeners)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once.
+
+    Records within the same second reuse the previous ``strftime`` result.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted) swapped as one tuple, so it's never torn
+        self._last = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        # Only whole-second formats can be cached (the default adds msecs)
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        last_second, formatted = self._last
+        if second != last_second:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._last = (second, formatted)
+        return formatted
+
+
+def _message(record: logging.LogRecord) -> str:
+    """Get a record's message, skipping getMessage for plain strings.
+
+    Records from the queue (and most call sites) carry a ready ``str``
+    with no args, so no ``%`` formatting is needed.
+
+    Args:
+        record: Record being formatted
+
+    Returns:
+        The formatted message
+    """
+    msg = record.msg
+    if not record.args and type(msg) is str:
+        return msg
+    return record.getMessage()
+
+
+def _with_exception(formatter: logging.Formatter, record: logging.LogRecord, text: str) -> str:
+    """Append traceback and stack info the way Formatter.format does.
+
+    Args:
+        formatter: Formatter used for the exception/stack text
+        record: Record being formatted
+        text: Formatted message line
+
+    Returns:
+        Message with any traceback/stack appended
+    """
+    if record.exc_info and not record.exc_text:
+        record.exc_text = formatter.formatException(record.exc_info)
+    if record.exc_text:
+        text = f"{text}\n{record.exc_text}"
+    if record.stack_info:
+        text = f"{text}\n{formatter.formatStack(record.stack_info)}"
+    return text
+
+
+class SimpleFormatter(logging.Formatter):
+    """``LEVEL: message``, built with an f-string instead of %-style interpolation"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = _message(record)
+        return _with_exception(self, record, f"{record.levelname}: {record.message}")
+
+
+class DetailedFormatter(CachedTimeFormatter):
+    """``time - name - LEVEL - message``, built with an f-string"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = _message(record)
+        return _with_exception(
+            self,
+            record,
+            f"{self.formatTime(record, self.datefmt)} - {record.name} - {record.levelname} - {record.message}"
+        )
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that drops the oldest record when full.
+
+    Logging never blocks the caller, and a log storm can't grow memory
+    without bound. Drops are counted for DropReportingListener to report.
+    """
+
+    def __init__(self, record_queue: queue.Queue):
+        """Initialize the handler.
+
+        Args:
+            record_queue: Bounded queue read by the listener
+        """
+        super().__init__(record_queue)
+        self._dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        # Runs under the handler lock (Handler.handle), so the count is safe
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._dropped += 1
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._dropped += 1  # Refilled by another logger's thread
+
+    def take_dropped(self) -> int:
+        """Get the number of records dropped since the last call.
+
+        Returns:
+            Dropped record count
+        """
+        self.acquire()
+        try:
+            dropped, self._dropped = self._dropped, 0
+        finally:
+            self.release()
+        return dropped
+
+
+class DropReportingListener(QueueListener):
+    """QueueListener that logs, at most once a second, how many records the
+    queue handler had to drop."""
+
+    def __init__(self, queue_handler: DroppingQueueHandler, *handlers, respect_handler_level: bool = False):
+        """Initialize the listener.
+
+        Args:
+            queue_handler: Handler feeding the queue
+            *handlers: Handlers that write the records
+            respect_handler_level: Apply each handler's level
+        """
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=respect_handler_level)
+        self.queue_handler = queue_handler
+        self._last_report = 0.0
+
+    def handle(self, record: logging.LogRecord):
+        now = time.monotonic()
+        if now - self._last_report >= 1.0:
+            dropped = self.queue_handler.take_dropped()
+            if dropped:
+                self._last_report = now
+                super().handle(logging.makeLogRecord({
+                    "name": record.name,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": f"Log queue full, dropped {dropped} record(s)"
+                }))
+        super().handle(record)
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """StreamHandler writing UTF-8 bytes straight to the stream's buffer.
+
+    Skips the TextIOWrapper's encoding for each record. Text already
+    written to the stream (print, rich) is flushed first, so records never
+    land ahead of or inside it; streams without a byte buffer (e.g.
+    captured output in tests) go through StreamHandler as usual.
+    """
+
+    def __init__(self, stream=None):
+        """Initialize the handler.
+
+        Args:
+            stream: Text stream to log to (sys.stderr if not provided)
+        """
+        super().__init__(stream)
+        self._buffer = getattr(self.stream, "buffer", None)
+
+    def emit(self, record: logging.LogRecord):
+        if self._buffer is None:
+            return super().emit(record)
+        try:
+            data = f"{self.format(record)}{self.terminator}".encode("utf-8", "backslashreplace")
+            self.stream.flush()
+            self._buffer.write(data)
+            self._buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that writes through a large buffer.
+
+    The stock handler flushes after every record and checks the file
+    position for rollover each time. This one lets a 64 KiB buffer collect
+    records, tracks the file size in-process (in characters, close enough
+    for rollover), and flushes on a timer, on errors and on close.
+    """
+
+    def __init__(self, *args, buffer_size: int = 64 * 1024, flush_interval: float = 0.5, **kwargs):
+        """Initialize the handler.
+
+        Args:
+            *args: Passed to RotatingFileHandler
+            buffer_size: Write buffer size in bytes
+            flush_interval: Seconds between background flushes (bounds what
+                a crash can lose)
+            **kwargs: Passed to RotatingFileHandler
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._bytes_written = 0
+        super().__init__(*args, **kwargs)
+
+        self._flush_stop = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True).start()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self.maxBytes > 0 and self._bytes_written >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+            # Don't leave errors sitting in the buffer
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """No-op per record; the buffer is flushed by the timer and close()."""
+
+    def _flush_periodically(self):
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.acquire()
+            try:
+                if self.stream is not None and not self.stream.closed:
+                    self.stream.flush()
+            finally:
+                self.release()
+
+    def close(self):
+        self._flush_stop.set()
+        # Closing the stream writes out whatever is still buffered
+        super().close()
+
+
+def create_file_handler(log_file_path: str) -> BufferedRotatingFileHandler:
+    """Create the rotating log file handler with the detailed layout.
+
+    Args:
+        log_file_path: Path to the log file (its directory is created)
+
+    Returns:
+        File handler logging everything from DEBUG up
+    """
+    os.makedirs(os.path.dirname(log_file_path) or ".", exist_ok=True)
+
+    file_handler = BufferedRotatingFileHandler(
+        filename=log_file_path,
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,
+        encoding="utf-8"
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(DetailedFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+    return file_handler
+
 
 def setup_logger(
     name: str = "circlenclick",
     log_file: Optional[str] = None,
     log_level: Optional[str] = None,
+    console: bool = True,
 ) -> logging.Logger:
     """Set up and configure a logger.
 
+    Records are handed to a queue and written by a background listener
+    thread, so logging calls don't block on console or file I/O.
+
     Args:
         name: Logger name
         log_file: Path to log file (uses settings.log_file if not provided)
         log_level: Logging level (uses settings.log_level if not provided)
+        console: Also log to stdout (off for processes whose stdout is a
+            protocol channel, e.g. the native messaging host)
 
     Returns:
         Configured logger instance
@@ -32,46 +352,83 @@ def setup_logger(
 
     # Set log level
     level = log_level or settings.log_level
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(_LEVELS.get(level.upper(), logging.INFO))
 
     # Create formatters
-    detailed_formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    simple_formatter = logging.Formatter(
-        fmt="%(levelname)s: %(message)s"
-    )
+    # Fixed layouts, formatted without %-style interpolation:
+    #   "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    #   "%(levelname)s: %(message)s"
+    detailed_formatter = DetailedFormatter(datefmt="%Y-%m-%d %H:%M:%S")
+    simple_formatter = SimpleFormatter()
+
+    handlers = []
 
     # Console handler (stdout)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO if not settings.debug else logging.DEBUG)
-    console_handler.setFormatter(simple_formatter if not settings.debug else detailed_formatter)
-    logger.addHandler(console_handler)
+    if console:
+        console_handler = ConsoleHandler(sys.stdout)
+        # Only give the console its own level when it is stricter than the
+        # logger's; otherwise NOTSET, as the logger has already filtered
+        console_level = logging.INFO if not settings.debug else logging.DEBUG
+        if console_level > logger.level:
+            console_handler.setLevel(console_level)
+        console_handler.setFormatter(simple_formatter if not settings.debug else detailed_formatter)
+        handlers.append(console_handler)
 
-    # File handler (if log file specified)
+    # File handler (if log file specified). With a log server configured,
+    # the shared application log goes to it instead, so worker processes
+    # don't each rotate the same file; dedicated logs stay local.
     log_file_path = log_file or settings.log_file
-    if log_file_path:
-        file_path = Path(log_file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = RotatingFileHandler(
-            filename=str(file_path),
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding="utf-8"
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+    if settings.log_socket_host and not log_file:
+        socket_handler = SocketHandler(settings.log_socket_host, settings.log_socket_port)
+        socket_handler.setLevel(logging.DEBUG)
+        handlers.append(socket_handler)
+    elif log_file_path:
+        handlers.append(create_file_handler(log_file_path))
+
+    # The logger only enqueues; the listener thread owns the real handlers
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.log_queue_size))
+    logger.addHandler(queue_handler)
+    listener = DropReportingListener(queue_handler, *handlers, respect_handler_level=True)
+    listener.start()
+    listeners.append(listener)
 
     return logger
 
 
+# The "circlenclick" logger, configured on first use so importing this
+# module opens no log file
+_root_logger: Optional[logging.Logger] = None
+_root_lock = threading.Lock()
+
+
+def _get_root_logger() -> logging.Logger:
+    """Get the application logger, setting it up on first call.
+
+    Returns:
+        Configured "circlenclick" logger
+    """
+    global _root_logger
+    if _root_logger is None:
+        with _root_lock:
+            if _root_logger is None:
+                _root_logger = setup_logger()
+    return _root_logger
+
+
+class _LazyLogger:
+    """Stand-in for the application logger that sets it up on first use."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(_get_root_logger(), name)
+
+
 # Global logger instance
-logger = setup_logger()
+logger = _LazyLogger()
 
 
+@functools.lru_cache(maxsize=512)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with a specific name.
 
@@ -81,4 +438,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
+    # Records propagate to the application logger's handlers, so make sure
+    # it is configured
+    _get_root_logger()
     return logging.getLogger(f"circlenclick.{name}")